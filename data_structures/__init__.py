@@ -0,0 +1,62 @@
+"""Data structures: linked lists, queues, stacks, caches, trees and
+heaps.
+
+Nothing is imported up front. Each name below is loaded from its
+submodule the first time it is looked up on the package, so
+`import data_structures` costs next to nothing and a worker only
+pays for the structures it actually uses.
+"""
+
+# public name -> (submodule, attribute in that submodule)
+_exports = {
+    'ListNode': ('doubly_linked_list', 'ListNode'),
+    'DoublyLinkedList': ('doubly_linked_list', 'DoublyLinkedList'),
+    'SkipListIndex': ('doubly_linked_list', 'SkipListIndex'),
+    'ArrayDoublyLinkedList': ('array_doubly_linked_list',
+                              'ArrayDoublyLinkedList'),
+    'UnrolledLinkedList': ('unrolled_linked_list', 'UnrolledLinkedList'),
+    'RingBuffer': ('ring_buffer', 'RingBuffer'),
+    'Queue': ('dll_queue', 'Queue'),
+    'MinMaxQueue': ('min_max_queue', 'MinMaxQueue'),
+    'PriorityQueue': ('priority_queue', 'PriorityQueue'),
+    'BlockingQueue': ('blocking_queue', 'BlockingQueue'),
+    'AsyncQueue': ('async_queue', 'AsyncQueue'),
+    'AsyncStack': ('async_queue', 'AsyncStack'),
+    'SharedMemoryQueue': ('shared_memory_queue', 'SharedMemoryQueue'),
+    'SpillingQueue': ('spilling_queue', 'SpillingQueue'),
+    'Stack': ('dll_stack', 'Stack'),
+    'MinMaxStack': ('dll_stack', 'MinMaxStack'),
+    'InstrumentedQueue': ('instrumentation', 'InstrumentedQueue'),
+    'InstrumentedStack': ('instrumentation', 'InstrumentedStack'),
+    'QueueMetrics': ('instrumentation', 'QueueMetrics'),
+    'WorkStealingDeque': ('work_stealing', 'WorkStealingDeque'),
+    'WorkStealingScheduler': ('work_stealing', 'WorkStealingScheduler'),
+    'LRUCache': ('lru_cache', 'LRUCache'),
+    'TimingWheel': ('timing_wheel', 'TimingWheel'),
+    'ShardedLRUCache': ('lru_cache', 'ShardedLRUCache'),
+    'lru_memoize': ('lru_cache', 'lru_memoize'),
+    'default_weigher': ('lru_cache', 'default_weigher'),
+    'BinarySearchTree': ('binary_search_tree', 'BinarySearchTree'),
+    'MaxHeap': ('max_heap', 'Heap'),
+    'Heap': ('generic_heap', 'Heap'),
+    'AVLTree': ('avl_tree', 'AVLTree'),
+}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from importlib import import_module
+
+    module_name, attr = _exports[name]
+    value = getattr(import_module(f'.{module_name}', __name__), attr)
+    # cache it so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,188 @@
+"""Implement a doubly linked list on top of parallel arrays"""
+from array import array
+
+# handle used in place of None for a missing prev/next/head/tail
+NIL = -1
+
+
+class ArrayDoublyLinkedList:
+    """A doubly-linked list with the same methods as
+    DoublyLinkedList, but instead of ListNode objects every entry
+    is a slot in three parallel arrays: a list of values and two
+    array('l') buffers of prev and next slot numbers. Nodes are
+    addressed by integer handles (their slot number), and freed
+    slots are chained through the next buffer and reused."""
+
+    def __init__(self):
+        self.values = []
+        self.prev = array('l')
+        self.next = array('l')
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        # first slot of the chain of freed slots
+        self._free = NIL
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        if self.head == NIL:
+            return "empty"
+
+        parts = []
+        curr = self.head
+        while curr != NIL:
+            parts.append(f'( {self.values[curr]} ) <-> ')
+            curr = self.next[curr]
+
+        return ''.join(parts)
+
+    def value(self, handle):
+        """Returns the value stored at the given handle"""
+        return self.values[handle]
+
+    def add_to_head(self, value):
+        """Stores the value in a free slot and links it in as the
+        new head of the list. Returns the new node's handle."""
+        handle = self._alloc(value)
+        self._link_head(handle)
+        self.length += 1
+        return handle
+
+    def add_to_tail(self, value):
+        """Stores the value in a free slot and links it in as the
+        new tail of the list. Returns the new node's handle."""
+        handle = self._alloc(value)
+        self._link_tail(handle)
+        self.length += 1
+        return handle
+
+    def remove_from_head(self):
+        """Removes the list's current head, returning its value"""
+        if self.head == NIL:
+            return
+        return self.delete(self.head)
+
+    def remove_from_tail(self):
+        """Removes the list's current tail, returning its value"""
+        if self.tail == NIL:
+            return
+        return self.delete(self.tail)
+
+    def move_to_front(self, handle):
+        """Relinks the node at handle as the new head"""
+        if handle == self.head:
+            return
+        self._unlink(handle)
+        self._link_head(handle)
+
+    def move_to_end(self, handle):
+        """Relinks the node at handle as the new tail"""
+        if handle == self.tail:
+            return
+        self._unlink(handle)
+        self._link_tail(handle)
+
+    def delete(self, handle):
+        """Removes the node at handle from the list, frees its
+        slot and returns its value"""
+        if self.head == NIL:
+            return
+
+        value = self.values[handle]
+        self._unlink(handle)
+        self.length -= 1
+
+        # push the slot onto the free chain
+        self.values[handle] = None
+        self.next[handle] = self._free
+        self._free = handle
+
+        return value
+
+    def get_max(self):
+        """Returns the highest value currently in the list"""
+        if self.head == NIL:
+            return
+
+        values = self.values
+        nxt = self.next
+        curr = self.head
+        curr_max = values[curr]
+
+        while curr != NIL:
+            if values[curr] > curr_max:
+                curr_max = values[curr]
+            curr = nxt[curr]
+
+        return curr_max
+
+    def find_middle(self):
+        """Returns the middle value, the left one if there are
+        two."""
+        if self.head == NIL:
+            return
+
+        head = self.head
+        tail = self.tail
+
+        while head != tail and self.next[head] != tail:
+            head = self.next[head]
+            tail = self.prev[tail]
+
+        return self.values[head]
+
+    def _alloc(self, value):
+        """Returns a detached slot holding value, reusing a freed
+        slot when there is one"""
+        if self._free != NIL:
+            handle = self._free
+            self._free = self.next[handle]
+            self.values[handle] = value
+            return handle
+
+        self.values.append(value)
+        self.prev.append(NIL)
+        self.next.append(NIL)
+        return len(self.values) - 1
+
+    def _unlink(self, handle):
+        """Detaches a slot from the chain without changing the
+        length"""
+        prev = self.prev[handle]
+        nxt = self.next[handle]
+
+        if prev == NIL:
+            self.head = nxt
+        else:
+            self.next[prev] = nxt
+
+        if nxt == NIL:
+            self.tail = prev
+        else:
+            self.prev[nxt] = prev
+
+    def _link_head(self, handle):
+        """Links a detached slot in as the new head"""
+        self.prev[handle] = NIL
+        self.next[handle] = self.head
+
+        if self.head == NIL:
+            self.tail = handle
+        else:
+            self.prev[self.head] = handle
+
+        self.head = handle
+
+    def _link_tail(self, handle):
+        """Links a detached slot in as the new tail"""
+        self.next[handle] = NIL
+        self.prev[handle] = self.tail
+
+        if self.tail == NIL:
+            self.head = handle
+        else:
+            self.next[self.tail] = handle
+
+        self.tail = handle
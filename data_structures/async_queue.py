@@ -0,0 +1,185 @@
+"""Implement asyncio-native queue and stack"""
+import asyncio
+from collections import deque
+
+from .doubly_linked_list import DoublyLinkedList
+
+
+class AsyncContainer:
+    """Shared waiting logic for AsyncQueue and AsyncStack, modelled
+    on asyncio.Queue. Elements live in a storage engine
+    (DoublyLinkedList by default, or RingBuffer); subclasses decide
+    which end they are added to and taken from.
+
+    Coroutines waiting for an element or for room park on futures
+    kept in FIFO order and are woken one at a time. A waiter that is
+    cancelled after being woken hands its wakeup on to the next one,
+    so no element or free slot is ever left unclaimed."""
+
+    def __init__(self, maxsize=0, engine=DoublyLinkedList):
+        self.storage = engine()
+        self.maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+
+    def len(self):
+        return self.storage.length
+
+    def empty(self):
+        return self.storage.length == 0
+
+    def full(self):
+        return 0 < self.maxsize <= self.storage.length
+
+    async def _put_item(self, value):
+        """Waits for room, then adds value"""
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                self._abandon(putter, self._putters, not self.full())
+                raise
+        self._put_item_nowait(value)
+
+    def _put_item_nowait(self, value):
+        if self.full():
+            raise asyncio.QueueFull
+        self._add(value)
+        self._wakeup_next(self._getters)
+
+    async def _get_item(self):
+        """Waits for an element, then removes and returns it"""
+        await self._wait_for_items()
+        return self._get_item_nowait()
+
+    def _get_item_nowait(self):
+        if self.empty():
+            raise asyncio.QueueEmpty
+        value = self._remove()
+        self._wakeup_next(self._putters)
+        return value
+
+    async def _get_batch(self, max_items, timeout):
+        """Waits up to timeout seconds for at least one element, then
+        removes up to max_items of them without yielding"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        # wait_for resumes us a loop iteration after the wait ends, so
+        # another consumer may have emptied us again; keep waiting
+        while self.empty():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return []
+            try:
+                await asyncio.wait_for(self._wait_for_items(), remaining)
+            except asyncio.TimeoutError:
+                return []
+
+        count = min(max_items, self.storage.length)
+        batch = [self._remove() for _ in range(count)]
+        for _ in range(count):
+            self._wakeup_next(self._putters)
+        return batch
+
+    async def _wait_for_items(self):
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                self._abandon(getter, self._getters, not self.empty())
+                raise
+
+    def _abandon(self, waiter, waiters, can_proceed):
+        """Cleans up after a cancelled waiter. If it had already been
+        woken, the wakeup is passed on to the next waiter."""
+        # cancel() does nothing to a waiter that was already woken,
+        # so cancelled() afterwards tells the two cases apart
+        waiter.cancel()
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            # it was already popped off by _wakeup_next
+            pass
+        if can_proceed and not waiter.cancelled():
+            self._wakeup_next(waiters)
+
+    def _wakeup_next(self, waiters):
+        """Wakes the first waiter that is still waiting"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _add(self, value):
+        raise NotImplementedError
+
+    def _remove(self):
+        raise NotImplementedError
+
+
+class AsyncQueue(AsyncContainer):
+    """A first-in, first-out queue for asyncio tasks. With maxsize
+    above 0, enqueue waits for room, which gives producers
+    backpressure."""
+
+    async def enqueue(self, value):
+        await self._put_item(value)
+
+    def enqueue_nowait(self, value):
+        """Adds value or raises asyncio.QueueFull"""
+        self._put_item_nowait(value)
+
+    async def dequeue(self):
+        return await self._get_item()
+
+    def dequeue_nowait(self):
+        """Returns the front value or raises asyncio.QueueEmpty"""
+        return self._get_item_nowait()
+
+    async def dequeue_batch(self, max_items, timeout=None):
+        """Waits up to timeout seconds (forever if None) for at
+        least one item, then returns up to max_items of them, front
+        first. Returns an empty list if nothing arrived in time."""
+        return await self._get_batch(max_items, timeout)
+
+    def _add(self, value):
+        self.storage.add_to_head(value)
+
+    def _remove(self):
+        return self.storage.remove_from_tail()
+
+
+class AsyncStack(AsyncContainer):
+    """A last-in, first-out stack for asyncio tasks. With maxsize
+    above 0, push waits for room."""
+
+    async def push(self, value):
+        await self._put_item(value)
+
+    def push_nowait(self, value):
+        """Pushes value or raises asyncio.QueueFull"""
+        self._put_item_nowait(value)
+
+    async def pop(self):
+        return await self._get_item()
+
+    def pop_nowait(self):
+        """Returns the top value or raises asyncio.QueueEmpty"""
+        return self._get_item_nowait()
+
+    async def pop_batch(self, max_items, timeout=None):
+        """Like AsyncQueue.dequeue_batch, most recent item first"""
+        return await self._get_batch(max_items, timeout)
+
+    def _add(self, value):
+        self.storage.add_to_head(value)
+
+    def _remove(self):
+        return self.storage.remove_from_head()
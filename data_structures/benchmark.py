@@ -0,0 +1,392 @@
+"""Benchmark the linked list, queue and stack against the builtins
+
+Run with `python -m data_structures.benchmark`. Every operation
+is timed at each size, ops/sec and bytes per element are printed, and
+the results are written to a JSON file so two runs can be compared
+with `--compare old.json`.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import time
+import tracemalloc
+from collections import deque
+from functools import lru_cache
+
+from .doubly_linked_list import DoublyLinkedList
+from .array_doubly_linked_list import ArrayDoublyLinkedList, NIL
+from .unrolled_linked_list import UnrolledLinkedList
+from .dll_queue import Queue
+from .dll_stack import Stack
+from .ring_buffer import RingBuffer
+from .instrumentation import InstrumentedQueue
+from .lru_cache import lru_memoize
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+
+def _call(name):
+    """Returns a runner that calls obj.name() n times"""
+    def run(obj, n):
+        method = getattr(obj, name)
+        for _ in range(n):
+            method()
+    return run
+
+
+def _call_with_value(name):
+    """Returns a runner that calls obj.name(None) n times"""
+    def run(obj, n):
+        method = getattr(obj, name)
+        for _ in range(n):
+            method(None)
+    return run
+
+
+def _call_on_each(name):
+    """Returns a runner that calls obj.name(node) for every node in
+    a prepared list of nodes"""
+    def run(state, n):
+        obj, nodes = state
+        method = getattr(obj, name)
+        for node in nodes:
+            method(node)
+    return run
+
+
+def _traverse(obj, n):
+    for _ in obj:
+        pass
+
+
+def _traverse_array(obj, n):
+    values = obj.values
+    nxt = obj.next
+    curr = obj.head
+    while curr != NIL:
+        values[curr]
+        curr = nxt[curr]
+
+
+def _dll_with_nodes(n):
+    """Returns a filled DoublyLinkedList and its nodes, shuffled"""
+    dll = DoublyLinkedList.from_iterable([None] * n)
+    nodes = []
+    node = dll.head
+    while node is not None:
+        nodes.append(node)
+        node = node.next
+    random.Random(n).shuffle(nodes)
+    return dll, nodes
+
+
+def _array_with_handles(n):
+    """Returns a filled ArrayDoublyLinkedList and its handles,
+    shuffled"""
+    adll = _filled_array(n)
+    handles = list(range(n))
+    random.Random(n).shuffle(handles)
+    return adll, handles
+
+
+def _filled_array(n):
+    adll = ArrayDoublyLinkedList()
+    add = adll.add_to_tail
+    for _ in range(n):
+        add(None)
+    return adll
+
+
+def _filled_unrolled(n):
+    ull = UnrolledLinkedList()
+    add = ull.add_to_tail
+    for _ in range(n):
+        add(None)
+    return ull
+
+
+def _filled_queue(n):
+    q = Queue()
+    q.storage.extend([None] * n)
+    return q
+
+
+def _filled_stack(n):
+    s = Stack()
+    s.storage.extend([None] * n)
+    return s
+
+
+def _filled_ring_queue(n):
+    q = Queue(RingBuffer)
+    enqueue = q.enqueue
+    for _ in range(n):
+        enqueue(None)
+    return q
+
+
+def _filled_ring_stack(n):
+    s = Stack(RingBuffer)
+    push = s.push
+    for _ in range(n):
+        push(None)
+    return s
+
+
+def _filled_instrumented_queue(n):
+    q = InstrumentedQueue()
+    enqueue = q.enqueue
+    for _ in range(n):
+        enqueue(None)
+    return q
+
+
+def _memoized(decorator):
+    """Returns a setup that builds an identity function memoized by
+    decorator with room for n results"""
+    def setup(n):
+        return decorator(n)(lambda x: x)
+    return setup
+
+
+def _warm_memoized(decorator):
+    """Like _memoized, with the results for 0 to n - 1 already
+    cached"""
+    def setup(n):
+        function = decorator(n)(lambda x: x)
+        for i in range(n):
+            function(i)
+        return function
+    return setup
+
+
+def _call_range(function, n):
+    for i in range(n):
+        function(i)
+
+
+# subject -> operation -> (setup(n), run(state, n))
+SUBJECTS = {
+    'DoublyLinkedList': {
+        'add_to_head': (lambda n: DoublyLinkedList(),
+                        _call_with_value('add_to_head')),
+        'add_to_tail': (lambda n: DoublyLinkedList(),
+                        _call_with_value('add_to_tail')),
+        'remove_from_head': (lambda n: DoublyLinkedList.from_iterable([None] * n),
+                             _call('remove_from_head')),
+        'remove_from_tail': (lambda n: DoublyLinkedList.from_iterable([None] * n),
+                             _call('remove_from_tail')),
+        'move_to_front': (_dll_with_nodes, _call_on_each('move_to_front')),
+        'delete': (_dll_with_nodes, _call_on_each('delete')),
+        'traverse': (lambda n: DoublyLinkedList.from_iterable([None] * n),
+                     _traverse),
+    },
+    'ArrayDoublyLinkedList': {
+        'add_to_head': (lambda n: ArrayDoublyLinkedList(),
+                        _call_with_value('add_to_head')),
+        'add_to_tail': (lambda n: ArrayDoublyLinkedList(),
+                        _call_with_value('add_to_tail')),
+        'remove_from_head': (_filled_array, _call('remove_from_head')),
+        'remove_from_tail': (_filled_array, _call('remove_from_tail')),
+        'move_to_front': (_array_with_handles, _call_on_each('move_to_front')),
+        'delete': (_array_with_handles, _call_on_each('delete')),
+        'traverse': (_filled_array, _traverse_array),
+    },
+    'UnrolledLinkedList': {
+        'add_to_head': (lambda n: UnrolledLinkedList(),
+                        _call_with_value('add_to_head')),
+        'add_to_tail': (lambda n: UnrolledLinkedList(),
+                        _call_with_value('add_to_tail')),
+        'remove_from_head': (_filled_unrolled, _call('remove_from_head')),
+        'remove_from_tail': (_filled_unrolled, _call('remove_from_tail')),
+        'traverse': (_filled_unrolled, _traverse),
+    },
+    'Queue': {
+        'enqueue': (lambda n: Queue(), _call_with_value('enqueue')),
+        'dequeue': (_filled_queue, _call('dequeue')),
+    },
+    'Stack': {
+        'push': (lambda n: Stack(), _call_with_value('push')),
+        'pop': (_filled_stack, _call('pop')),
+    },
+    'Queue(RingBuffer)': {
+        'enqueue': (lambda n: Queue(RingBuffer), _call_with_value('enqueue')),
+        'dequeue': (_filled_ring_queue, _call('dequeue')),
+    },
+    'Stack(RingBuffer)': {
+        'push': (lambda n: Stack(RingBuffer), _call_with_value('push')),
+        'pop': (_filled_ring_stack, _call('pop')),
+    },
+    'InstrumentedQueue': {
+        'enqueue': (lambda n: InstrumentedQueue(), _call_with_value('enqueue')),
+        'dequeue': (_filled_instrumented_queue, _call('dequeue')),
+    },
+    'lru_memoize': {
+        'hit': (_warm_memoized(lru_memoize), _call_range),
+        'miss': (_memoized(lru_memoize), _call_range),
+    },
+    'functools.lru_cache': {
+        'hit': (_warm_memoized(lru_cache), _call_range),
+        'miss': (_memoized(lru_cache), _call_range),
+    },
+    'deque': {
+        'add_to_head': (lambda n: deque(), _call_with_value('appendleft')),
+        'add_to_tail': (lambda n: deque(), _call_with_value('append')),
+        'remove_from_head': (lambda n: deque([None] * n), _call('popleft')),
+        'remove_from_tail': (lambda n: deque([None] * n), _call('pop')),
+        'traverse': (lambda n: deque([None] * n), _traverse),
+    },
+    'list': {
+        'add_to_tail': (lambda n: [], _call_with_value('append')),
+        'remove_from_tail': (lambda n: [None] * n, _call('pop')),
+        'traverse': (lambda n: [None] * n, _traverse),
+    },
+}
+
+# how to build a structure of n elements for the memory numbers
+BUILDERS = {
+    'DoublyLinkedList': lambda n: DoublyLinkedList.from_iterable([None] * n),
+    'ArrayDoublyLinkedList': _filled_array,
+    'UnrolledLinkedList': _filled_unrolled,
+    'Queue': _filled_queue,
+    'Stack': _filled_stack,
+    'Queue(RingBuffer)': _filled_ring_queue,
+    'Stack(RingBuffer)': _filled_ring_stack,
+    'InstrumentedQueue': _filled_instrumented_queue,
+    'lru_memoize': _warm_memoized(lru_memoize),
+    'functools.lru_cache': _warm_memoized(lru_cache),
+    'deque': lambda n: deque([None] * n),
+    'list': lambda n: [None] * n,
+}
+
+
+def time_operation(setup, run, n, repeat=3):
+    """Returns the best wall time, in seconds, of running n
+    operations on a freshly set up structure"""
+    best = None
+    for _ in range(repeat):
+        state = setup(n)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state, n)
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        del state
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def measure_memory(build, n):
+    """Returns the bytes allocated per element while building a
+    structure of n elements"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        structure = build(n)
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return allocated / n
+
+
+def run_benchmarks(sizes=None, subjects=None, repeat=3, memory=True,
+                   report=None):
+    """Times every operation of every subject at every size.
+    Returns a dict ready to be written out as JSON. If report is
+    given it is called with each timing result as it comes in."""
+    sizes = sizes or DEFAULT_SIZES
+    subjects = subjects or list(SUBJECTS)
+
+    results = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'timings': [],
+        'memory': [],
+    }
+
+    for n in sizes:
+        for subject in subjects:
+            for op, (setup, run) in SUBJECTS[subject].items():
+                seconds = time_operation(setup, run, n, repeat)
+                entry = {
+                    'subject': subject,
+                    'op': op,
+                    'size': n,
+                    'seconds': seconds,
+                    'ops_per_sec': n / seconds if seconds else None,
+                }
+                results['timings'].append(entry)
+                if report is not None:
+                    report(entry)
+
+            if memory:
+                results['memory'].append({
+                    'subject': subject,
+                    'size': n,
+                    'bytes_per_element': measure_memory(BUILDERS[subject], n),
+                })
+
+    return results
+
+
+def compare(old, new):
+    """Returns (subject, op, size, old ops/sec, new ops/sec, ratio)
+    for every timing present in both result dicts"""
+    before = {(t['subject'], t['op'], t['size']): t['ops_per_sec']
+              for t in old['timings']}
+    rows = []
+    for t in new['timings']:
+        key = (t['subject'], t['op'], t['size'])
+        if key in before and before[key] and t['ops_per_sec']:
+            rows.append(key + (before[key], t['ops_per_sec'],
+                               t['ops_per_sec'] / before[key]))
+    return rows
+
+
+def _print_timing(entry):
+    print(f"{entry['subject']:>22} {entry['op']:>17} {entry['size']:>9} "
+          f"{entry['ops_per_sec']:>14,.0f} ops/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--subjects', nargs='+', choices=list(SUBJECTS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the tracemalloc bytes/element pass')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', metavar='OLD_JSON',
+                        help='print the change against an earlier run')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.subjects, args.repeat,
+                             not args.no_memory, _print_timing)
+
+    for entry in results['memory']:
+        print(f"{entry['subject']:>22} {'memory':>17} {entry['size']:>9} "
+              f"{entry['bytes_per_element']:>14,.1f} bytes/element")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'results written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        for subject, op, size, before, after, ratio in compare(old, results):
+            print(f'{subject:>22} {op:>17} {size:>9} {before:>14,.0f} -> '
+                  f'{after:>14,.0f} ops/s ({ratio - 1:+.1%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Implement a thread-safe, bounded, blocking queue"""
+import threading
+import time
+from queue import Empty, Full
+
+from .dll_queue import Queue
+from .doubly_linked_list import DoublyLinkedList
+
+
+class BlockingQueue(Queue):
+    """A Queue that can be shared between threads. Every method
+    holds one lock. If maxsize is above 0, enqueue blocks while the
+    queue is full; dequeue blocks while it is empty. Both take block
+    and timeout arguments and raise queue.Full / queue.Empty the same
+    way the standard library's queue.Queue does.
+
+    put_many and get_batch move many items per lock acquisition,
+    which is what keeps consumers from contending on the lock for
+    every single item."""
+
+    def __init__(self, maxsize=0, engine=DoublyLinkedList):
+        super().__init__(engine)
+        self.maxsize = maxsize
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+
+    def enqueue(self, value, block=True, timeout=None):
+        """Adds value to the back of the queue, waiting for room if
+        the queue is full"""
+        with self.not_full:
+            self._wait_for_room(block, timeout)
+            self.storage.add_to_head(value)
+            self.not_empty.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """Removes and returns the value at the front of the queue,
+        waiting for one if the queue is empty"""
+        with self.not_empty:
+            if not self._wait_for_items(block, timeout):
+                raise Empty
+            value = self.storage.remove_from_tail()
+            self.not_full.notify()
+            return value
+
+    def put_many(self, values, block=True, timeout=None):
+        """Adds every value in order, filling whatever room there is
+        each time the lock is taken. If the timeout runs out part
+        way, the values already added stay and queue.Full is
+        raised."""
+        values = list(values)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+
+        with self.not_full:
+            while added < len(values):
+                remaining = None
+                if deadline is not None:
+                    remaining = max(deadline - time.monotonic(), 0)
+                self._wait_for_room(block, remaining)
+
+                # add as many as fit in one go
+                room = len(values) - added
+                if self.maxsize > 0:
+                    room = min(room, self.maxsize - self.storage.length)
+                add = self.storage.add_to_head
+                for value in values[added:added + room]:
+                    add(value)
+                added += room
+                self.not_empty.notify(room)
+
+    def get_batch(self, max_items, timeout=None):
+        """Waits up to timeout seconds (forever if None) for at
+        least one item, then removes and returns up to max_items
+        items, front first, under a single lock acquisition.
+        Returns an empty list if nothing arrived in time."""
+        with self.not_empty:
+            if not self._wait_for_items(True, timeout):
+                return []
+
+            count = min(max_items, self.storage.length)
+            remove = self.storage.remove_from_tail
+            batch = [remove() for _ in range(count)]
+            self.not_full.notify(count)
+            return batch
+
+    def len(self):
+        with self.mutex:
+            return self.storage.length
+
+    def _wait_for_room(self, block, timeout):
+        """Waits, with the lock held, until there is room for at
+        least one more item, raising queue.Full if there isn't"""
+        if self.maxsize <= 0:
+            return
+        if not block:
+            if self.storage.length >= self.maxsize:
+                raise Full
+            return
+        if not self.not_full.wait_for(
+                lambda: self.storage.length < self.maxsize, timeout):
+            raise Full
+
+    def _wait_for_items(self, block, timeout):
+        """Waits, with the lock held, until there is at least one
+        item. Returns False if there still isn't one."""
+        if not block:
+            return self.storage.length > 0
+        return self.not_empty.wait_for(lambda: self.storage.length > 0,
+                                       timeout)
@@ -0,0 +1,20 @@
+from .doubly_linked_list import DoublyLinkedList
+
+class Queue:
+    """A first-in, first-out queue. engine is the storage class,
+    DoublyLinkedList by default; pass RingBuffer to keep the
+    elements in one contiguous buffer instead of allocating a
+    node for each one."""
+
+    def __init__(self, engine=DoublyLinkedList):
+        # Why is our DLL a good choice to store our elements?
+        self.storage = engine()
+
+    def enqueue(self, value):
+        self.storage.add_to_head(value)
+
+    def dequeue(self):
+        return self.storage.remove_from_tail()
+
+    def len(self):
+        return self.storage.length
@@ -0,0 +1,56 @@
+from .doubly_linked_list import DoublyLinkedList
+
+class Stack:
+    """A last-in, first-out stack. engine is the storage class,
+    DoublyLinkedList by default; pass RingBuffer to keep the
+    elements in one contiguous buffer instead of allocating a
+    node for each one."""
+
+    def __init__(self, engine=DoublyLinkedList):
+        # Why is our DLL a good choice to store our elements?
+        self.storage = engine()
+
+    def push(self, value):
+        self.storage.add_to_head(value)
+
+    def pop(self):
+        return self.storage.remove_from_head()
+
+    def len(self):
+        return self.storage.length
+
+
+class MinMaxStack(Stack):
+    """A Stack that can report its smallest and largest values in
+    O(1). Two auxiliary stacks hold every value that was a new
+    minimum or maximum when it was pushed, so the current one is
+    always on top."""
+
+    def __init__(self, engine=DoublyLinkedList):
+        super().__init__(engine)
+        self.mins = []
+        self.maxes = []
+
+    def push(self, value):
+        self.storage.add_to_head(value)
+        # push ties as well, so popping one copy leaves the other
+        if not self.mins or value <= self.mins[-1]:
+            self.mins.append(value)
+        if not self.maxes or value >= self.maxes[-1]:
+            self.maxes.append(value)
+
+    def pop(self):
+        if self.storage.length == 0:
+            return None
+        value = self.storage.remove_from_head()
+        if value == self.mins[-1]:
+            self.mins.pop()
+        if value == self.maxes[-1]:
+            self.maxes.pop()
+        return value
+
+    def get_min(self):
+        return self.mins[-1] if self.mins else None
+
+    def get_max(self):
+        return self.maxes[-1] if self.maxes else None
@@ -0,0 +1,1324 @@
+"""Implement a doubly linked list data structure"""
+
+class ListNode:
+    """Each ListNode holds a reference to its previous node
+    as well as its next node in the List. __slots__ keeps
+    each node down to its three references."""
+
+    __slots__ = ('value', 'prev', 'next')
+
+    def __init__(self, value, prev=None, next=None):
+        self.value = value
+        self.prev = prev
+        self.next = next
+
+    def insert_after(self, value):
+        """Wrap the given value in a ListNode and insert it
+        after this node. Note that this node could already
+        have a next node it is point to."""
+        current_next = self.next
+        self.next = ListNode(value, self, current_next)
+        if current_next:
+            current_next.prev = self.next
+
+    def insert_before(self, value):
+        """Wrap the given value in a ListNode and insert it
+        before this node. Note that this node could already
+        have a previous node it is point to."""
+        current_prev = self.prev
+        self.prev = ListNode(value, current_prev, self)
+        if current_prev:
+            current_prev.next = self.prev
+
+    def delete(self):
+        """Rearranges this ListNode's previous and next pointers
+        accordingly, effectively deleting this ListNode."""
+        if self.prev:
+            self.prev.next = self.next
+        if self.next:
+            self.next.prev = self.prev
+
+class IndexNode:
+    """One level of a SkipListIndex tower. It points at the
+    ListNode it stands for, its neighbours on the same level and
+    the tower nodes above and below it. span is how many list
+    positions there are from this node to its next node."""
+
+    __slots__ = ('node', 'prev', 'next', 'up', 'down', 'span')
+
+    def __init__(self, node):
+        self.node = node
+        self.prev = None
+        self.next = None
+        self.up = None
+        self.down = None
+        self.span = 0
+
+
+class SkipListIndex:
+    """A positional skip list laid over the nodes of a
+    DoublyLinkedList. The list itself is the bottom level; each
+    node gets a tower of IndexNodes of random height, and the span
+    counts on each level let positions be found in O(log n)
+    expected time. The header towers stand at position -1.
+
+    Bulk relinking (splice, split_at, move_range) marks the index
+    stale and it is rebuilt in one pass the next time a position
+    is looked up."""
+
+    max_level = 32
+    promote = 0.25
+
+    def __init__(self, dll):
+        # imported here so lists without an index never load it
+        from random import random
+        self.random = random
+        self.dll = dll
+        self.header = [IndexNode(None) for _ in range(self.max_level)]
+        for lower, upper in zip(self.header, self.header[1:]):
+            lower.up = upper
+            upper.down = lower
+        # number of levels currently in use
+        self.level = 0
+        # first tower node of every ListNode that has a tower
+        self.towers = {}
+        self.stale = dll._head is not None
+
+    def node_at(self, index):
+        """Returns the ListNode at the given position"""
+        if self.stale:
+            self.rebuild()
+
+        x = None
+        pos = -1
+        if self.level:
+            # drop down the levels, skipping ahead while we can
+            x = self.header[self.level - 1]
+            while True:
+                while x.next is not None and pos + x.span <= index:
+                    pos += x.span
+                    x = x.next
+                if x.down is None:
+                    break
+                x = x.down
+
+        # walk the rest of the way along the list itself
+        if x is None or x.node is None:
+            node = self.dll._head
+            pos = 0
+        else:
+            node = x.node
+        while pos < index:
+            node = node.next
+            pos += 1
+
+        return node
+
+    def rank(self, node):
+        """Returns the position of a ListNode in the list"""
+        if self.stale:
+            self.rebuild()
+
+        # step back along the list to the nearest tower
+        steps = 0
+        towers = self.towers
+        while node not in towers:
+            if node.prev is None:
+                return steps
+            node = node.prev
+            steps += 1
+
+        # climb each tower and step left until the header
+        x = towers[node]
+        pos = 0
+        while x.node is not None:
+            while x.up is not None:
+                x = x.up
+            x = x.prev
+            pos += x.span
+
+        return pos - 1 + steps
+
+    def insert(self, index, node):
+        """Adds a tower for a ListNode just linked in at index"""
+        if self.stale:
+            return
+
+        preds, ranks = self._predecessors(index)
+
+        # pick a height and open up any new levels
+        random = self.random
+        height = 0
+        while height < self.max_level and random() < self.promote:
+            height += 1
+        while self.level < height:
+            preds.append(self.header[self.level])
+            ranks.append(-1)
+            self.level += 1
+
+        below = None
+        for lvl in range(height):
+            pred = preds[lvl]
+            tower = IndexNode(node)
+            tower.prev = pred
+            tower.next = pred.next
+            if pred.next is not None:
+                pred.next.prev = tower
+                tower.span = ranks[lvl] + pred.span + 1 - index
+            pred.next = tower
+            pred.span = index - ranks[lvl]
+
+            if below is None:
+                self.towers[node] = tower
+            else:
+                below.up = tower
+                tower.down = below
+            below = tower
+
+        # levels the tower doesn't reach just got one longer
+        for lvl in range(height, self.level):
+            if preds[lvl].next is not None:
+                preds[lvl].span += 1
+
+    def remove(self, index, node):
+        """Drops the tower of the ListNode at index, which is
+        about to be unlinked"""
+        if self.stale:
+            return
+
+        preds, ranks = self._predecessors(index)
+        for lvl in range(self.level):
+            pred = preds[lvl]
+            tower = pred.next
+            if tower is not None and tower.node is node:
+                pred.next = tower.next
+                if tower.next is not None:
+                    tower.next.prev = pred
+                    pred.span += tower.span - 1
+            elif tower is not None:
+                pred.span -= 1
+
+        self.towers.pop(node, None)
+
+        # let go of levels that are now empty
+        while self.level and self.header[self.level - 1].next is None:
+            self.level -= 1
+
+    def discard(self, node):
+        """Drops the tower of a ListNode wherever it is"""
+        if self.stale:
+            return
+        self.remove(self.rank(node), node)
+
+    def invalidate(self):
+        """Marks the index as needing a rebuild"""
+        self.stale = True
+        self.towers = {}
+        self.level = 0
+        for header in self.header:
+            header.next = None
+
+    def rebuild(self):
+        """Builds fresh towers for every node in one pass"""
+        self.invalidate()
+        last = list(self.header)
+        last_rank = [-1] * self.max_level
+        random = self.random
+
+        node = self.dll._head
+        index = 0
+        while node is not None:
+            height = 0
+            while height < self.max_level and random() < self.promote:
+                height += 1
+
+            below = None
+            for lvl in range(height):
+                tower = IndexNode(node)
+                tower.prev = last[lvl]
+                last[lvl].next = tower
+                last[lvl].span = index - last_rank[lvl]
+                last[lvl] = tower
+                last_rank[lvl] = index
+
+                if below is None:
+                    self.towers[node] = tower
+                else:
+                    below.up = tower
+                    tower.down = below
+                below = tower
+
+            if height > self.level:
+                self.level = height
+            node = node.next
+            index += 1
+
+        self.stale = False
+
+    def _predecessors(self, index):
+        """Returns, for every level in use, the last tower node
+        before position index and that node's position"""
+        preds = [None] * self.level
+        ranks = [-1] * self.level
+        if not self.level:
+            return preds, ranks
+
+        x = self.header[self.level - 1]
+        pos = -1
+        for lvl in range(self.level - 1, -1, -1):
+            while x.next is not None and pos + x.span < index:
+                pos += x.span
+                x = x.next
+            preds[lvl] = x
+            ranks[lvl] = pos
+            x = x.down
+
+        return preds, ranks
+
+
+class DoublyLinkedList:
+    """Our doubly-linked list class. It holds references to
+    the list's head and tail nodes.
+
+    If pool_size is given, up to that many removed nodes are kept
+    on a free list and reused by the add methods instead of
+    allocating new ones. Only use the pool if nothing holds on to
+    nodes after they have been removed from the list.
+
+    If track_aggregates is set, the list keeps a running min, max
+    and sum of its values as they are added and removed, so
+    get_max, get_min and get_sum don't have to scan. Removing the
+    current min or max marks the aggregates stale and the next
+    query rescans once.
+
+    If indexed is set, a SkipListIndex is kept over the nodes so
+    get, insert_at, delete_at and find_middle find positions in
+    O(log n) instead of walking the list.
+
+    reverse_list only flips a direction flag. While the list is
+    reversed, head and tail and every method work in the flipped
+    order, but the nodes' own next and prev pointers still point
+    the old way, so walk a reversed list with iteration rather than
+    by following next. materialize relinks the nodes to match."""
+
+    def __init__(self, node=None, pool_size=0, track_aggregates=False,
+                 indexed=False):
+        self._head = node
+        self._tail = node
+        self.length = 1 if node is not None else 0
+        # free list of removed nodes waiting to be reused
+        self.pool_size = pool_size
+        self._pool = []
+        # running aggregates, only kept up when tracking
+        self.track_aggregates = track_aggregates
+        self._min = None
+        self._max = None
+        self._sum = 0
+        self._stale = node is not None
+        # positional skip list, only kept when indexed
+        self._index = SkipListIndex(self) if indexed else None
+        # set while head and tail are swapped by reverse_list
+        self._reversed = False
+
+    @property
+    def head(self):
+        return self._tail if self._reversed else self._head
+
+    @head.setter
+    def head(self, node):
+        if self._reversed:
+            self._tail = node
+        else:
+            self._head = node
+
+    @property
+    def tail(self):
+        return self._head if self._reversed else self._tail
+
+    @tail.setter
+    def tail(self, node):
+        if self._reversed:
+            self._head = node
+        else:
+            self._tail = node
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Builds a new list holding the values of iterable in
+        order. Keyword arguments go to the constructor."""
+        dll = cls(**kwargs)
+        dll.extend(iterable)
+        return dll
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yields each value from head to tail. The next node is
+        read before yielding, so the current node may be deleted
+        while iterating."""
+        if self._reversed:
+            return self._walk(self._tail, False)
+        return self._walk(self._head, True)
+
+    def __reversed__(self):
+        """Yields each value from tail to head"""
+        if self._reversed:
+            return self._walk(self._head, True)
+        return self._walk(self._tail, False)
+
+    def _walk(self, node, forward, n=None):
+        """Yields up to n values from node along the next pointers,
+        or along the prev pointers if forward is False"""
+        curr_node = node
+        while curr_node is not None and n != 0:
+            next_node = curr_node.next if forward else curr_node.prev
+            yield curr_node.value
+            curr_node = next_node
+            if n is not None:
+                n -= 1
+
+    def __str__(self):
+        if self._head is None and self._tail is None:
+            return "empty"
+
+        return ''.join(self._render())
+
+    def iter_from(self, node, n=None, reverse=False):
+        """Yields up to n values starting at the given node and
+        walking towards the tail, or towards the head if reverse
+        is set. With n left as None it runs to the end."""
+        return self._walk(node, reverse == self._reversed, n)
+
+    def write_to(self, file, chunk_size=1024):
+        """Writes the same text as str() to a file-like object,
+        chunk_size nodes per write, so long lists never have to be
+        built up as a single string."""
+        if self._head is None and self._tail is None:
+            file.write("empty")
+            return
+
+        chunk = []
+        for part in self._render():
+            chunk.append(part)
+            if len(chunk) >= chunk_size:
+                file.write(''.join(chunk))
+                chunk.clear()
+
+        if chunk:
+            file.write(''.join(chunk))
+
+    def _render(self):
+        """Yields the printed form of each node in order"""
+        for value in self:
+            yield f'( {value} ) <-> '
+
+    def add_to_head(self, value):
+        """Wraps the given value in a ListNode and inserts it
+        as the new head of the list. Don't forget to handle
+        the old head node's previous pointer accordingly."""
+
+        # instantiate new node, reusing a pooled one if we can;
+        # inlined, since every add goes through here
+        if self._pool:
+            new_head = self._pool.pop()
+            new_head.value = value
+        else:
+            new_head = ListNode(value)
+
+        # grab prev head
+        old_head = self._head
+
+        # increment length
+        self.length += 1
+
+        # if list is empty
+        if self._head is None and self._tail is None:
+            # set head to new_head
+            self._head = new_head
+            # set tail to new_head
+            self._tail = new_head
+        else:
+            # new_node's next node is the old head
+            new_head.next = old_head
+            # old_head's prev node is the new_head
+            old_head.prev = new_head
+            # set head to new_head
+            self._head = new_head
+
+        if self.track_aggregates:
+            self._add_aggregate(value)
+        if self._index is not None:
+            self._index.insert(0, new_head)
+
+    def remove_from_head(self):
+        """Removes the List's current head node, making the
+        current head's next node the new head of the List.
+        Returns the value of the removed Node."""
+
+        # if list is empty
+        if self._head is None and self._tail is None:
+            return
+
+        # grab the head and its value
+        old_head = self._head
+        value = old_head.value
+
+        # handle 1 node in list
+        if self._head == self._tail:
+            # set head and tail to None, back to 0 nodes
+            self._head = None
+            self._tail = None
+            self.length -= 1
+        # there are multiple ListNodes
+        else:
+            # next_head will be current head's next node
+            next_head = self._head.next
+            # set next_head.prev to None
+            # erasing the ref to node to be removed
+            next_head.prev = None
+            # erase current head's next node
+            self._head.next = None
+            # set next head as the new head
+            self._head = next_head
+            # decrement length
+            self.length -= 1
+
+        if self.track_aggregates:
+            self._remove_aggregate(value)
+        if self._index is not None:
+            self._index.remove(0, old_head)
+
+        # hand the node back to the pool if it has room; its
+        # links were cleared above
+        if self.pool_size and len(self._pool) < self.pool_size:
+            old_head.value = None
+            self._pool.append(old_head)
+
+        return value
+
+    def add_to_tail(self, value):
+        """Wraps the given value in a ListNode and inserts it
+        as the new tail of the list. Don't forget to handle
+        the old tail node's next pointer accordingly."""
+
+        # instantiate new node, reusing a pooled one if we can;
+        # inlined, since every add goes through here
+        if self._pool:
+            new_tail = self._pool.pop()
+            new_tail.value = value
+        else:
+            new_tail = ListNode(value)
+
+        # grab prev tail
+        curr_tail = self._tail
+
+        # increment length
+        self.length += 1
+
+        # if list is empty
+        if self._head is None and self._tail is None:
+            # set head to new_head
+            self._tail = new_tail
+            # set tail to new_head
+            self._head = new_tail
+        else:
+            # new_tail's prev node is the old tail
+            new_tail.prev = curr_tail
+            # curr_tail's next node is the new_tail
+            curr_tail.next = new_tail
+            # set tail to new_tail
+            self._tail = new_tail
+
+        if self.track_aggregates:
+            self._add_aggregate(value)
+        if self._index is not None:
+            self._index.insert(self.length - 1, new_tail)
+
+    def remove_from_tail(self):
+        """Removes the List's current tail node, making the
+        current tail's previous node the new tail of the List.
+        Returns the value of the removed Node."""
+
+        # if list is empty
+        if self._head is None and self._tail is None:
+            return
+
+        # grab the tail and its value
+        old_tail = self._tail
+        value = old_tail.value
+
+        # handle 1 node in list
+        if self._head == self._tail:
+            # set head and tail to None, back to 0 nodes
+            self._head = None
+            self._tail = None
+            self.length -= 1
+        # there are multiple ListNodes
+        else:
+            # next_tail will be current tail's prev node
+            next_tail = self._tail.prev
+            # set next_tail.next to None
+            # erasing the ref to node to be removed
+            next_tail.next = None
+            # erase current tail's prev node
+            self._tail.prev = None
+            # set next tail as the new tail
+            self._tail = next_tail
+            # decrement length
+            self.length -= 1
+
+        if self.track_aggregates:
+            self._remove_aggregate(value)
+        if self._index is not None:
+            self._index.remove(self.length, old_tail)
+
+        # hand the node back to the pool if it has room; its
+        # links were cleared above
+        if self.pool_size and len(self._pool) < self.pool_size:
+            old_tail.value = None
+            self._pool.append(old_tail)
+
+        return value
+
+    # the physical ends, whichever way the list faces; the public
+    # names above work on these directly until the list is reversed
+    _add_head = add_to_head
+    _remove_head = remove_from_head
+    _add_tail = add_to_tail
+    _remove_tail = remove_from_tail
+
+    def extend(self, iterable):
+        """Adds every value of iterable to the tail, in order.
+        The new nodes are chained in one pass and the length and
+        bookkeeping are updated once at the end."""
+        if self._reversed:
+            self._extend_head(iterable)
+        else:
+            self._extend_tail(iterable)
+
+    def _extend_tail(self, iterable):
+        """Chains new nodes on after the physical tail"""
+        if iterable is self:
+            iterable = list(self)
+
+        prev_node = self._tail
+        count = 0
+        for value in iterable:
+            new_node = ListNode(value, prev_node)
+            if prev_node is None:
+                self._head = new_node
+            else:
+                prev_node.next = new_node
+            prev_node = new_node
+            count += 1
+
+        if count:
+            self._tail = prev_node
+            self.length += count
+            self._bulk_changed()
+
+    def extendleft(self, iterable):
+        """Adds every value of iterable to the head one after the
+        other, so they end up in reverse order, like
+        deque.extendleft. Done in one pass like extend."""
+        if self._reversed:
+            self._extend_tail(iterable)
+        else:
+            self._extend_head(iterable)
+
+    def _extend_head(self, iterable):
+        """Chains new nodes on before the physical head"""
+        if iterable is self:
+            iterable = list(self)
+
+        next_node = self._head
+        count = 0
+        for value in iterable:
+            new_node = ListNode(value, None, next_node)
+            if next_node is None:
+                self._tail = new_node
+            else:
+                next_node.prev = new_node
+            next_node = new_node
+            count += 1
+
+        if count:
+            self._head = next_node
+            self.length += count
+            self._bulk_changed()
+
+    def remove_many_from_head(self, n):
+        """Removes up to n nodes from the head with a single cut
+        and returns their values, head first"""
+        if self._reversed:
+            return self._remove_many_tail(n)
+        return self._remove_many_head(n)
+
+    def _remove_many_head(self, n):
+        """Cuts up to n nodes off the physical head"""
+        values = []
+        curr_node = self._head
+        last_removed = None
+        while curr_node is not None and len(values) < n:
+            values.append(curr_node.value)
+            last_removed = curr_node
+            curr_node = curr_node.next
+
+        if last_removed is None:
+            return values
+
+        # cut the list after the last removed node
+        last_removed.next = None
+        self._head = curr_node
+        if curr_node is None:
+            self._tail = None
+        else:
+            curr_node.prev = None
+        self.length -= len(values)
+        self._bulk_changed()
+
+        return values
+
+    def remove_many_from_tail(self, n):
+        """Removes up to n nodes from the tail with a single cut
+        and returns their values, tail first"""
+        if self._reversed:
+            return self._remove_many_head(n)
+        return self._remove_many_tail(n)
+
+    def _remove_many_tail(self, n):
+        """Cuts up to n nodes off the physical tail"""
+        values = []
+        curr_node = self._tail
+        last_removed = None
+        while curr_node is not None and len(values) < n:
+            values.append(curr_node.value)
+            last_removed = curr_node
+            curr_node = curr_node.prev
+
+        if last_removed is None:
+            return values
+
+        # cut the list before the last removed node
+        last_removed.prev = None
+        self._tail = curr_node
+        if curr_node is None:
+            self._head = None
+        else:
+            curr_node.next = None
+        self.length -= len(values)
+        self._bulk_changed()
+
+        return values
+
+    def clear(self):
+        """Removes every node from the list"""
+        self._head = None
+        self._tail = None
+        self.length = 0
+        self._bulk_changed()
+
+    def move_to_front(self, node):
+        """Removes the input node from its current spot in the
+        List and inserts it as the new head node of the List.
+        The node itself is relinked, so references to it stay
+        valid and no new ListNode is allocated."""
+        if self._reversed:
+            self._move_tail(node)
+        else:
+            self._move_head(node)
+
+    def _move_head(self, node):
+        """Relinks a node as the physical head"""
+        # handle if list is empty
+        if self._head is None and self._tail is None:
+            return
+
+        # handle if node is already at the front
+        if node is self._head:
+            return
+
+        # detach the node, length stays the same
+        if self._index is not None:
+            self._index.discard(node)
+        self._unlink(node)
+
+        # relink the same node at the head
+        self._link_head(node)
+        if self._index is not None:
+            self._index.insert(0, node)
+
+    def move_to_end(self, node):
+        """Removes the input node from its current spot in the
+        List and inserts it as the new tail node of the List.
+        The node itself is relinked, so references to it stay
+        valid and no new ListNode is allocated."""
+        if self._reversed:
+            self._move_head(node)
+        else:
+            self._move_tail(node)
+
+    def _move_tail(self, node):
+        """Relinks a node as the physical tail"""
+        # handle if list is empty
+        if self._head is None and self._tail is None:
+            return
+
+        # handle if node is already at end
+        if node is self._tail:
+            return
+
+        # detach the node, length stays the same
+        if self._index is not None:
+            self._index.discard(node)
+        self._unlink(node)
+
+        # relink the same node at the tail
+        self._link_tail(node)
+        if self._index is not None:
+            self._index.insert(self.length - 1, node)
+
+    def delete(self, node):
+        """Removes a node from the list and handles cases where
+        the node was the head or the tail"""
+
+        # no values in list
+        if self._head is None and self._tail is None:
+            return
+
+        # if node is the head
+        if node == self._head:
+            # this will remove from head
+            # and decrement length
+            self._remove_head()
+            return
+
+        # if node is the tail
+        if node == self._tail:
+            # this will remove from tail
+            # and decrement length
+            self._remove_tail()
+            return
+
+        if self._index is not None:
+            self._index.discard(node)
+        node.delete()
+        self.length -= 1
+        if self.track_aggregates:
+            self._remove_aggregate(node.value)
+        self._release(node)
+        return
+
+    def get_max(self):
+        """Returns the highest value currently in the list"""
+        if self._head is None:
+            return
+
+        if self.track_aggregates:
+            if self._stale:
+                self._refresh_aggregates()
+            return self._max
+
+        curr_max = self._head.value
+        curr_node = self._head
+
+        while curr_node.next is not None:
+            curr_node = curr_node.next
+
+            if curr_node.value > curr_max:
+                curr_max = curr_node.value
+
+        return curr_max
+
+    def get_min(self):
+        """Returns the lowest value currently in the list"""
+        if self._head is None:
+            return
+
+        if self.track_aggregates:
+            if self._stale:
+                self._refresh_aggregates()
+            return self._min
+
+        return min(self)
+
+    def get_sum(self):
+        """Returns the sum of the values currently in the list"""
+        if self.track_aggregates:
+            if self._stale:
+                self._refresh_aggregates()
+            return self._sum
+
+        return sum(self)
+
+    def get(self, index):
+        """Returns the value at the given position; negative
+        positions count back from the tail"""
+        return self._node_at(index).value
+
+    def insert_at(self, index, value):
+        """Inserts the value so that it ends up at the given
+        position, like list.insert"""
+        if index < 0:
+            index = max(index + self.length, 0)
+        if index == 0:
+            self.add_to_head(value)
+            return
+        if index >= self.length:
+            self.add_to_tail(value)
+            return
+
+        # the physical position the new node will take
+        if self._reversed:
+            index = self.length - index
+
+        # link a new node in front of the one there now
+        next_node = self._find_node(index)
+        new_node = self._new_node(value)
+        new_node.prev = next_node.prev
+        new_node.next = next_node
+        next_node.prev.next = new_node
+        next_node.prev = new_node
+        self.length += 1
+
+        if self.track_aggregates:
+            self._add_aggregate(value)
+        if self._index is not None:
+            self._index.insert(index, new_node)
+
+    def delete_at(self, index):
+        """Removes the node at the given position and returns its
+        value"""
+        node = self._node_at(index)
+        value = node.value
+        self.delete(node)
+        return value
+
+    def _node_at(self, index):
+        """Finds the node at a position, through the index if
+        there is one or else by walking from the nearer end"""
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError('list index out of range')
+
+        if self._reversed:
+            index = self.length - 1 - index
+        return self._find_node(index)
+
+    def _find_node(self, index):
+        """Finds the node at a physical position, which must be in
+        range"""
+        if self._index is not None:
+            return self._index.node_at(index)
+
+        if index < self.length // 2:
+            node = self._head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self.length - 1 - index):
+                node = node.prev
+        return node
+
+    def splice(self, other):
+        """Moves every node of the other list onto the tail of
+        this list in O(1). The nodes are relinked, not copied,
+        and the other list is left empty."""
+        # nothing to move, or splicing a list into itself
+        if other is self or other._head is None:
+            return
+
+        # point the other's nodes the same way as ours
+        if other._reversed != self._reversed:
+            other._relink_reversed()
+
+        if self._reversed:
+            # our logical tail is our physical head
+            if self._head is None:
+                self._tail = other._tail
+            else:
+                other._tail.next = self._head
+                self._head.prev = other._tail
+            self._head = other._head
+        else:
+            # this list is empty, just take over the other's nodes
+            if self._head is None:
+                self._head = other._head
+            else:
+                # join our tail to the other's head
+                self._tail.next = other._head
+                other._head.prev = self._tail
+
+            # the other's tail is our new tail
+            self._tail = other._tail
+        self.length += other.length
+
+        # fold the other's aggregates into ours
+        if self.track_aggregates:
+            if other.track_aggregates and not other._stale and not self._stale:
+                self._merge_aggregates(other)
+            else:
+                self._stale = True
+
+        # leave the other list empty
+        other._head = None
+        other._tail = None
+        other.length = 0
+        other._reset_aggregates()
+
+        # positions have shifted wholesale, rebuild on next lookup
+        if self._index is not None:
+            self._index.invalidate()
+        if other._index is not None:
+            other._index.invalidate()
+
+    def split_at(self, node):
+        """Cuts the list just before the given node. The node
+        and everything after it are moved, without copying, into
+        a new DoublyLinkedList which is returned. Relinking is
+        O(1); the length of the new list is counted by walking
+        the detached part."""
+        # build the new list around the detached run
+        new_list = DoublyLinkedList(pool_size=self.pool_size,
+                                    track_aggregates=self.track_aggregates,
+                                    indexed=self._index is not None)
+        new_list._set_reversed(self._reversed)
+
+        # count the nodes being detached
+        count = 0
+        curr_node = node
+        while curr_node is not None:
+            count += 1
+            curr_node = curr_node.prev if self._reversed else curr_node.next
+        new_list.length = count
+        self.length -= count
+
+        if self._reversed:
+            # the detached run is physically in front of node
+            new_list._head = self._head
+            new_list._tail = node
+            self._head = node.next
+            if self._head is None:
+                self._tail = None
+            else:
+                self._head.prev = None
+            node.next = None
+        else:
+            new_list._head = node
+            new_list._tail = self._tail
+
+            # the node before the cut becomes our tail
+            self._tail = node.prev
+            if self._tail is None:
+                self._head = None
+            else:
+                self._tail.next = None
+            node.prev = None
+
+        # neither side knows its aggregates any more
+        if self.length == 0:
+            self._reset_aggregates()
+        else:
+            self._stale = True
+        new_list._stale = True
+        if self._index is not None:
+            self._index.invalidate()
+            new_list._index.invalidate()
+
+        return new_list
+
+    def move_range(self, first, last, dest):
+        """Moves the run of nodes from first to last (inclusive,
+        first must come before last) onto the tail of dest, which
+        may be this list. The nodes are relinked, not copied; the
+        run is walked once to count its length."""
+        # lay the run out in physical order
+        if self._reversed:
+            first, last = last, first
+
+        # count the nodes in the run
+        count = 1
+        curr_node = first
+        while curr_node is not last:
+            curr_node = curr_node.next
+            count += 1
+
+        # detach the run from this list
+        before = first.prev
+        after = last.next
+        if before is None:
+            self._head = after
+        else:
+            before.next = after
+        if after is None:
+            self._tail = before
+        else:
+            after.prev = before
+        first.prev = None
+        last.next = None
+        self.length -= count
+
+        # turn the run around if dest points the other way
+        if dest._reversed != self._reversed:
+            curr_node = first
+            while curr_node is not None:
+                curr_node.prev, curr_node.next = curr_node.next, curr_node.prev
+                curr_node = curr_node.prev
+            first, last = last, first
+
+        if dest._reversed:
+            # attach the run to dest's physical head
+            if dest._head is None:
+                dest._tail = last
+            else:
+                last.next = dest._head
+                dest._head.prev = last
+            dest._head = first
+        else:
+            # attach the run to dest's tail
+            if dest._head is None:
+                dest._head = first
+            else:
+                dest._tail.next = first
+                first.prev = dest._tail
+            dest._tail = last
+        dest.length += count
+
+        # the moved values' aggregates are unknown on both sides
+        if dest is not self:
+            if self.length == 0:
+                self._reset_aggregates()
+            else:
+                self._stale = True
+            dest._stale = True
+        if self._index is not None:
+            self._index.invalidate()
+        if dest._index is not None:
+            dest._index.invalidate()
+
+    def _bulk_changed(self):
+        """Brings the aggregates and index up to date after many
+        nodes were linked or cut at once"""
+        if self.track_aggregates:
+            if self.length == 0:
+                self._reset_aggregates()
+            else:
+                self._stale = True
+        if self._index is not None:
+            self._index.invalidate()
+
+    def _add_aggregate(self, value):
+        """Folds a newly added value into the running aggregates"""
+        if self._stale:
+            return
+
+        if self.length == 1:
+            self._min = value
+            self._max = value
+            self._sum = value
+            return
+
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def _remove_aggregate(self, value):
+        """Takes a removed value out of the running aggregates,
+        marking them stale if it was the current min or max"""
+        if self.length == 0:
+            self._reset_aggregates()
+            return
+
+        if self._stale:
+            return
+
+        self._sum -= value
+        if value == self._min or value == self._max:
+            self._stale = True
+
+    def _merge_aggregates(self, other):
+        """Combines the aggregates of a list spliced onto this one"""
+        if other.length == 0:
+            return
+
+        if self.length == other.length:
+            self._min = other._min
+            self._max = other._max
+            self._sum = other._sum
+            return
+
+        self._sum += other._sum
+        if other._min < self._min:
+            self._min = other._min
+        if other._max > self._max:
+            self._max = other._max
+
+    def _reset_aggregates(self):
+        """Puts the aggregates back to their empty-list values"""
+        self._min = None
+        self._max = None
+        self._sum = 0
+        self._stale = False
+
+    def _refresh_aggregates(self):
+        """Recomputes min, max and sum with a single scan"""
+        self._reset_aggregates()
+        curr_node = self._head
+        if curr_node is None:
+            return
+
+        self._min = self._max = self._sum = curr_node.value
+        curr_node = curr_node.next
+        while curr_node is not None:
+            value = curr_node.value
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+            curr_node = curr_node.next
+
+    def _new_node(self, value):
+        """Returns a detached ListNode holding value, taken from
+        the pool when one is available."""
+        if self._pool:
+            node = self._pool.pop()
+            node.value = value
+            return node
+        return ListNode(value)
+
+    def _release(self, node):
+        """Clears a removed node and keeps it for reuse if the
+        pool has room."""
+        if len(self._pool) < self.pool_size:
+            node.value = None
+            node.prev = None
+            node.next = None
+            self._pool.append(node)
+
+    def _unlink(self, node):
+        """Detaches a node from the list, fixing up the head and
+        tail, without changing the length."""
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = None
+        node.next = None
+
+    def _link_head(self, node):
+        """Links a detached node in as the new head without
+        changing the length."""
+        node.prev = None
+        node.next = self._head
+
+        if self._head is None:
+            self._tail = node
+        else:
+            self._head.prev = node
+
+        self._head = node
+
+    def _link_tail(self, node):
+        """Links a detached node in as the new tail without
+        changing the length."""
+        node.next = None
+        node.prev = self._tail
+
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
+
+        self._tail = node
+
+    # LECTURE:
+    def find_middle(self):
+        """
+        Return the middle node of the doubly linked list,
+        if there are two nodes, return the left one,
+        no emptylist, length >= 1
+        1 - 2 - 3 = 2
+        1 - 2 - 3 - 4 : 2
+        With an index this is a single O(log n) lookup.
+        """
+        if self._head is None:
+            return
+
+        if self._index is not None:
+            return self.get((self.length - 1) // 2)
+
+        head = self._head
+
+        tail = self._tail
+
+        while head != tail and head.next != tail:
+            head = head.next
+            tail = tail.prev
+
+        # reversed, the left one of two is the physical right one
+        if self._reversed and head is not tail:
+            return tail.value
+
+        return head.value
+
+    def _set_reversed(self, flipped):
+        """Sets the direction flag. While it is set, the head and tail
+        methods are bound on the instance to the other end's, so an
+        unreversed list, by far the usual case, runs them with no
+        flag check or extra call."""
+        self._reversed = flipped
+        if flipped:
+            self.add_to_head = self._add_tail
+            self.remove_from_head = self._remove_tail
+            self.add_to_tail = self._add_head
+            self.remove_from_tail = self._remove_head
+        else:
+            for name in ('add_to_head', 'remove_from_head',
+                         'add_to_tail', 'remove_from_tail'):
+                self.__dict__.pop(name, None)
+
+    def reverse_list(self):
+        """
+        Reverse List
+        - no recursion
+        - nor store the dll in diff data structures
+        This only flips the list's direction flag, so it is O(1);
+        call materialize to relink the nodes themselves.
+        """
+        self._set_reversed(not self._reversed)
+        return self
+
+    def materialize(self):
+        """Relinks the nodes of a reversed list so that next
+        pointers run from head to tail again. O(n)."""
+        if self._reversed:
+            self._relink_reversed()
+        return self
+
+    def _relink_reversed(self):
+        """Swaps every node's next and prev pointers along with the
+        physical head and tail, and flips the direction flag, so
+        the logical order stays the same"""
+        curr_node = self._head
+        while curr_node is not None:
+            curr_node.prev, curr_node.next = curr_node.next, curr_node.prev
+            curr_node = curr_node.prev
+
+        self._head, self._tail = self._tail, self._head
+        self._set_reversed(not self._reversed)
+
+        # physical positions have all changed
+        if self._index is not None:
+            self._index.invalidate()
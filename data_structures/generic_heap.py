@@ -0,0 +1,57 @@
+class Heap:
+    """A binary heap stored in a list. comparator(a, b) returns True
+    if a should come out before b; without one it is a max heap."""
+
+    def __init__(self, comparator=lambda x, y: x > y):
+        self.storage = []
+        self.comparator = comparator
+
+    def insert(self, value):
+        # add to the end, then move it up to its place
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
+
+    def delete(self):
+        if not self.storage:
+            return None
+        # swap the top with the last value so it can be popped off
+        # the end, then move the new top down to its place
+        top = self.storage[0]
+        last = self.storage.pop()
+        if self.storage:
+            self.storage[0] = last
+            self._sift_down(0)
+        return top
+
+    def get_priority(self):
+        return self.storage[0] if self.storage else None
+
+    def get_size(self):
+        return len(self.storage)
+
+    def _bubble_up(self, index):
+        storage = self.storage
+        comes_first = self.comparator
+        while index > 0:
+            parent = (index - 1) // 2
+            if not comes_first(storage[index], storage[parent]):
+                break
+            storage[index], storage[parent] = storage[parent], storage[index]
+            index = parent
+
+    def _sift_down(self, index):
+        storage = self.storage
+        comes_first = self.comparator
+        size = len(storage)
+        while True:
+            # pick whichever child should come out first
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and comes_first(storage[right], storage[child]):
+                child = right
+            if not comes_first(storage[child], storage[index]):
+                break
+            storage[index], storage[child] = storage[child], storage[index]
+            index = child
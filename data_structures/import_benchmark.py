@@ -0,0 +1,66 @@
+"""Measure the cold import cost of the package and each submodule
+
+Run with `python -m data_structures.import_benchmark`. Every import is
+timed in a fresh interpreter, so nothing is already cached in
+sys.modules, and the median over --repeat runs is reported.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from . import _exports
+
+SUBMODULES = sorted({module for module, _ in _exports.values()})
+
+# runs in the child interpreter and prints the seconds taken
+_TIMER = (
+    'import time\n'
+    'start = time.perf_counter()\n'
+    'import {name}\n'
+    'print(time.perf_counter() - start)\n'
+)
+
+
+def time_import(name, repeat=5):
+    """Returns the median seconds a fresh interpreter takes to
+    import the named module"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _TIMER.format(name=name)],
+            cwd=root, check=True, capture_output=True, text=True,
+        ).stdout
+        samples.append(float(output))
+    return statistics.median(samples)
+
+
+def run_import_benchmarks(modules=None, repeat=5):
+    """Returns {module name: median import seconds} for the bare
+    package and each of its submodules"""
+    names = ['data_structures']
+    names += [f'data_structures.{module}' for module in modules or SUBMODULES]
+    return {name: time_import(name, repeat) for name in names}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modules', nargs='+', choices=SUBMODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='also write the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = run_import_benchmarks(args.modules, args.repeat)
+    for name, seconds in results.items():
+        print(f'{name:>42} {seconds * 1000:>8.3f} ms')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
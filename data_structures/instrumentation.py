@@ -0,0 +1,156 @@
+"""Implement opt-in metrics for queues and stacks"""
+import math
+import time
+
+from .dll_queue import Queue
+from .dll_stack import Stack
+from .doubly_linked_list import DoublyLinkedList
+
+# wait times are counted in power-of-two buckets of microseconds;
+# the last bucket takes everything from about 18 minutes up
+_BUCKETS = 32
+
+
+class QueueMetrics:
+    """Counters kept by InstrumentedQueue and InstrumentedStack.
+
+    Tracks the current and peak depth, how many values went in and
+    out, and a histogram of how long each value waited between being
+    added and removed. snapshot() returns all of it as a dict, with
+    rates per second since the previous snapshot() call.
+
+    If callback is given it is called with a snapshot at most once
+    every interval seconds, from whichever operation notices the
+    interval has passed. Its rates are over the time since the
+    previous report, kept apart from snapshot()'s, so taking
+    snapshots by hand doesn't skew them."""
+
+    def __init__(self, callback=None, interval=1.0):
+        self.callback = callback
+        self.interval = interval
+        self.depth = 0
+        self.peak_depth = 0
+        self.added = 0
+        self.removed = 0
+        self.wait_buckets = [0] * _BUCKETS
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+        now = time.perf_counter()
+        self.started = now
+        # (time, added, removed) at the last snapshot() and at the
+        # last report to callback; each rate window starts at its own
+        self.last_snapshot = (now, 0, 0)
+        self.last_report = (now, 0, 0)
+        self.next_report = now + interval if callback else math.inf
+
+    def record_add(self, now):
+        self.added += 1
+        self.depth += 1
+        if self.depth > self.peak_depth:
+            self.peak_depth = self.depth
+        if now >= self.next_report:
+            self._report(now)
+
+    def record_remove(self, now, added_at):
+        self.removed += 1
+        self.depth -= 1
+        wait = now - added_at
+        self.wait_total += wait
+        if wait > self.wait_max:
+            self.wait_max = wait
+        # bucket i holds waits under 2 ** i microseconds
+        bucket = int(wait * 1e6).bit_length()
+        self.wait_buckets[min(bucket, _BUCKETS - 1)] += 1
+        if now >= self.next_report:
+            self._report(now)
+
+    def snapshot(self, now=None):
+        """Returns the current metrics as a dict"""
+        now = time.perf_counter() if now is None else now
+        since = self.last_snapshot
+        self.last_snapshot = (now, self.added, self.removed)
+        return self._metrics(now, since)
+
+    def _metrics(self, now, since):
+        """Builds a snapshot with rates over the window from since,
+        a (time, added, removed) tuple, to now"""
+        then, added, removed = since
+        elapsed = max(now - then, 1e-9)
+
+        histogram = {}
+        for bucket, count in enumerate(self.wait_buckets):
+            if count:
+                upper = math.inf if bucket == _BUCKETS - 1 \
+                    else 2 ** bucket / 1e6
+                histogram[upper] = count
+
+        return {
+            'depth': self.depth,
+            'peak_depth': self.peak_depth,
+            'added': self.added,
+            'removed': self.removed,
+            'add_rate': (self.added - added) / elapsed,
+            'remove_rate': (self.removed - removed) / elapsed,
+            'uptime': now - self.started,
+            'wait_mean': self.wait_total / self.removed if self.removed else 0.0,
+            'wait_max': self.wait_max,
+            # upper bound in seconds -> number of values that waited
+            # less than that (and at least the previous bound)
+            'wait_histogram': histogram,
+        }
+
+    def _report(self, now):
+        self.next_report = now + self.interval
+        since = self.last_report
+        self.last_report = (now, self.added, self.removed)
+        self.callback(self._metrics(now, since))
+
+
+class InstrumentedQueue(Queue):
+    """A Queue that records QueueMetrics. Each value is stored
+    alongside the time it was enqueued. A plain Queue does none of
+    this, so code that doesn't opt in pays nothing."""
+
+    def __init__(self, engine=DoublyLinkedList, callback=None, interval=1.0):
+        super().__init__(engine)
+        self.metrics = QueueMetrics(callback, interval)
+
+    def enqueue(self, value):
+        now = time.perf_counter()
+        self.storage.add_to_head((now, value))
+        self.metrics.record_add(now)
+
+    def dequeue(self):
+        if self.storage.length == 0:
+            return None
+        added_at, value = self.storage.remove_from_tail()
+        self.metrics.record_remove(time.perf_counter(), added_at)
+        return value
+
+    def snapshot(self):
+        return self.metrics.snapshot()
+
+
+class InstrumentedStack(Stack):
+    """A Stack that records QueueMetrics, the same way
+    InstrumentedQueue does"""
+
+    def __init__(self, engine=DoublyLinkedList, callback=None, interval=1.0):
+        super().__init__(engine)
+        self.metrics = QueueMetrics(callback, interval)
+
+    def push(self, value):
+        now = time.perf_counter()
+        self.storage.add_to_head((now, value))
+        self.metrics.record_add(now)
+
+    def pop(self):
+        if self.storage.length == 0:
+            return None
+        added_at, value = self.storage.remove_from_head()
+        self.metrics.record_remove(time.perf_counter(), added_at)
+        return value
+
+    def snapshot(self):
+        return self.metrics.snapshot()
@@ -0,0 +1,442 @@
+import functools
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from .timing_wheel import TimingWheel
+
+
+class Entry:
+    """One key-value pair in an LRUCache, linked into the cache's
+    ring of entries. expires is when it stops being valid, or None,
+    timer is the TimingWheel slot holding it, and weight is what it
+    counts against the cache's max_weight."""
+    __slots__ = ('key', 'value', 'prev', 'next', 'expires', 'timer',
+                 'weight')
+
+    def __init__(self, key=None, value=None):
+        self.key = key
+        self.value = value
+        self.prev = self
+        self.next = self
+        self.expires = None
+        self.timer = None
+        self.weight = 0
+
+
+def default_weigher(key, value):
+    """Estimates a value's size in bytes: its length for bytes and
+    str, which is exact or close enough and costs nothing, and
+    sys.getsizeof for anything else"""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Our LRUCache class keeps track of the max number of entries it
+    can hold, the current number of entries it is holding, a ring
+    of linked entries that holds them in the correct order, as well
+    as a storage dict that provides fast access to every entry
+    stored in the cache.
+
+    The ring hangs off a sentinel entry, root, that is never removed:
+    root.next is the least-recently used entry and root.prev the
+    most-recently used one. With the sentinel there are no empty-list
+    or end-of-list cases, so every move is the same few pointer
+    writes, and a hit allocates nothing.
+
+    Entries can also expire. ttl is the default time to live in
+    seconds, measured with clock, and set can override it per entry.
+    get treats an expired entry as missing and removes it.
+    expire_due removes every expired entry without looking at the
+    live ones, using a TimingWheel with ticks of ttl_resolution
+    seconds that is only created once an entry has a TTL.
+
+    max_weight caps the total weight of the entries as well as, or
+    with limit=None instead of, their number. Each entry is weighed
+    with weigher(key, value) when it is set, default_weigher if none
+    is given. Entries are evicted from the least-recently used end
+    until the new one fits, and one that weighs more than max_weight
+    on its own is rejected and counted in rejections.
+    """
+    def __init__(self, limit=10, ttl=None, clock=time.monotonic,
+                 ttl_resolution=1.0, max_weight=None, weigher=None):
+        self.limit = limit
+        self.max_weight = max_weight
+        self.weigher = weigher or default_weigher
+        self.total_weight = 0
+        self.ttl = ttl
+        self.clock = clock
+        self.ttl_resolution = ttl_resolution
+        self.wheel = None
+        self.size = 0
+        # set up the empty ring
+        self.root = Entry()
+        # set up a dictionary to find each entry by its key
+        self.store = dict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+
+    def __len__(self):
+        return self.size
+
+    def get(self, key, default=None):
+        """
+        Retrieves the value associated with the given key. Also
+        needs to move the key-value pair to the end of the order
+        such that the pair is considered most-recently used.
+        Returns the value associated with the key or default if the
+        key-value pair doesn't exist in the cache.
+        """
+        entry = self.store.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires = entry.expires
+        if expires is not None and expires <= self.clock():
+            self._remove(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        # move it to the end inline; this is the hottest path
+        root = self.root
+        last = root.prev
+        if last is not entry:
+            entry.prev.next = entry.next
+            entry.next.prev = entry.prev
+            entry.prev = last
+            entry.next = root
+            last.next = entry
+            root.prev = entry
+        return entry.value
+
+    def set(self, key, value, ttl=None):
+        """
+        Adds the given key-value pair to the cache. The newly-
+        added pair should be considered the most-recently used
+        entry in the cache. If the cache is already at max capacity
+        before this entry is added, then the oldest entry in the
+        cache needs to be removed to make room. Additionally, in the
+        case that the key already exists in the cache, we simply
+        want to overwrite the old value associated with the key with
+        the newly-specified value. ttl, if given, replaces the
+        cache's default time to live for this entry.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else self.clock() + ttl
+
+        weight = 0
+        if self.max_weight is not None:
+            weight = self.weigher(key, value)
+            if weight > self.max_weight:
+                # drop any old value too, rather than serve it stale
+                entry = self.store.get(key)
+                if entry is not None:
+                    self._remove(entry)
+                self.rejections += 1
+                return
+
+        entry = self.store.get(key)
+        # if key exists, overwrite it and order by last used
+        if entry is not None:
+            entry.value = value
+            self.total_weight += weight - entry.weight
+            entry.weight = weight
+            self._move_to_end(entry)
+            self._set_expiry(entry, expires)
+            self._evict_to_weight()
+            return
+
+        if self.limit is not None and self.limit <= 0:
+            return
+
+        # handle max capacity by reusing the oldest entry
+        if self.size == self.limit:
+            entry = self.root.next
+            self._unlink(entry)
+            del self.store[entry.key]
+            self.total_weight -= entry.weight
+            entry.key = key
+            entry.value = value
+            self.evictions += 1
+        else:
+            entry = Entry(key, value)
+            self.size += 1
+
+        entry.weight = weight
+        self.total_weight += weight
+        self._link_at_end(entry)
+        self.store[key] = entry
+        self._set_expiry(entry, expires)
+        self._evict_to_weight()
+
+    def expire_due(self):
+        """Removes every entry that has expired and returns how many
+        there were. Meant to be called regularly, e.g. from an event
+        loop; each call costs O(1) per tick passed plus the entries
+        it removes."""
+        if self.wheel is None:
+            return 0
+        expired = self.wheel.advance(self.clock())
+        for entry in expired:
+            self._remove(entry)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Removes every entry and resets the counters"""
+        self.store.clear()
+        self.root.prev = self.root.next = self.root
+        self.wheel = None
+        self.size = 0
+        self.total_weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+
+    def _move_to_end(self, entry):
+        """Makes entry the most-recently used"""
+        root = self.root
+        if root.prev is entry:
+            return
+        self._unlink(entry)
+        self._link_at_end(entry)
+
+    def _set_expiry(self, entry, expires):
+        if entry.timer is not None:
+            self.wheel.remove(entry)
+        entry.expires = expires
+        if expires is not None:
+            if self.wheel is None:
+                self.wheel = TimingWheel(self.ttl_resolution, self.clock())
+            self.wheel.add(entry)
+
+    def _evict_to_weight(self):
+        """Evicts from the least-recently used end until the entries
+        fit in max_weight"""
+        if self.max_weight is None:
+            return
+        while self.total_weight > self.max_weight:
+            self._remove(self.root.next)
+            self.evictions += 1
+
+    def _remove(self, entry):
+        self._unlink(entry)
+        del self.store[entry.key]
+        if entry.timer is not None:
+            self.wheel.remove(entry)
+        self.total_weight -= entry.weight
+        self.size -= 1
+
+    def _unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _link_at_end(self, entry):
+        root = self.root
+        last = root.prev
+        entry.prev = last
+        entry.next = root
+        last.next = entry
+        root.prev = entry
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions limit size')
+
+# marks a miss, since None is a value a function can return
+_MISSING = object()
+# separates positional from keyword arguments in a key
+_KWARGS_MARK = object()
+# arguments of these types are their own key
+_FAST_TYPES = {int, str}
+
+
+def _make_key(args, kwargs, typed):
+    """Builds a cache key from a call's arguments, the same way
+    functools.lru_cache does"""
+    if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    return key
+
+
+def lru_memoize(limit=128, typed=False, key=None):
+    """
+    Decorator that caches a function's results in an LRUCache holding
+    up to limit of them. Works like functools.lru_cache: with typed
+    set, 1 and 1.0 are cached separately, and the wrapper gets
+    cache_info() and cache_clear(). key, if given, is called with the
+    function's arguments and returns the cache key to use instead.
+    The LRUCache itself is available as the wrapper's cache attribute.
+
+    Like LRUCache, it is not thread-safe. Can also be used bare, as
+    @lru_memoize.
+    """
+    if callable(limit):
+        # used as @lru_memoize with no arguments
+        return lru_memoize()(limit)
+
+    def decorator(function):
+        cache = LRUCache(limit)
+        cache_get = cache.get
+        cache_set = cache.set
+
+        if key is not None:
+            def wrapper(*args, **kwargs):
+                cache_key = key(*args, **kwargs)
+                result = cache_get(cache_key, _MISSING)
+                if result is _MISSING:
+                    result = function(*args, **kwargs)
+                    cache_set(cache_key, result)
+                return result
+        elif not typed:
+            def wrapper(*args, **kwargs):
+                # plain positional calls skip building a key
+                if kwargs:
+                    cache_key = _make_key(args, kwargs, False)
+                elif len(args) == 1 and type(args[0]) in _FAST_TYPES:
+                    cache_key = args[0]
+                else:
+                    cache_key = args
+                result = cache_get(cache_key, _MISSING)
+                if result is _MISSING:
+                    result = function(*args, **kwargs)
+                    cache_set(cache_key, result)
+                return result
+        else:
+            def wrapper(*args, **kwargs):
+                cache_key = _make_key(args, kwargs, True)
+                result = cache_get(cache_key, _MISSING)
+                if result is _MISSING:
+                    result = function(*args, **kwargs)
+                    cache_set(cache_key, result)
+                return result
+
+        def cache_info():
+            return CacheInfo(cache.hits, cache.misses, cache.evictions,
+                             cache.limit, cache.size)
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache.clear
+        return functools.update_wrapper(wrapper, function)
+
+    return decorator
+
+
+class ShardedLRUCache:
+    """
+    An LRU cache that many threads can use at once. Keys are hashed
+    across a number of independent LRUCaches, the shards, each behind
+    its own lock, so threads only contend when their keys land on the
+    same shard. The shard limits add up to limit. Recency is tracked
+    per shard, so the entry evicted is the least-recently used one in
+    its shard rather than in the whole cache. ttl, clock,
+    ttl_resolution and weigher are passed on to every shard as they
+    are.
+
+    max_weight is split across the shards the same way, and each
+    shard rejects entries heavier than its own slice. So that only
+    entries heavier than max_entry_weight can be rejected, the number
+    of shards is capped at max_weight // max_entry_weight, which
+    leaves every slice at least that big. max_entry_weight defaults
+    to max_weight, which accepts anything that fits the whole budget
+    but means a single shard; pass the heaviest entry you expect to
+    keep the cache sharded.
+    """
+    def __init__(self, limit=10, shards=16, ttl=None, clock=time.monotonic,
+                 ttl_resolution=1.0, max_weight=None, weigher=None,
+                 max_entry_weight=None):
+        self.limit = limit
+        self.max_weight = max_weight
+        # no point having shards that can hold nothing
+        count = shards if limit is None else max(1, min(shards, limit))
+        if max_weight is not None:
+            # every slice has to fit the heaviest entry we accept
+            heaviest = max_entry_weight
+            if heaviest is None:
+                heaviest = max_weight
+            count = max(1, min(count, max_weight // max(heaviest, 1)))
+        self.max_entry_weight = max_entry_weight
+        limits = _split(limit, count)
+        weights = _split(max_weight, count)
+        self.shards = [
+            LRUCache(limits[i], ttl, clock, ttl_resolution, weights[i],
+                     weigher)
+            for i in range(count)
+        ]
+        self.locks = [threading.Lock() for _ in range(count)]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards)
+
+    def get(self, key, default=None):
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            return self.shards[index].get(key, default)
+
+    def set(self, key, value, ttl=None):
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            self.shards[index].set(key, value, ttl)
+
+    def expire_due(self):
+        """Runs LRUCache.expire_due on each shard in turn and returns
+        the total removed"""
+        removed = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                removed += shard.expire_due()
+        return removed
+
+    def stats(self):
+        """Returns the hit, miss, eviction and size totals across all
+        shards, and the same numbers for each shard under 'shards'"""
+        shards = []
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                shards.append({
+                    'hits': shard.hits,
+                    'misses': shard.misses,
+                    'evictions': shard.evictions,
+                    'expirations': shard.expirations,
+                    'rejections': shard.rejections,
+                    'size': shard.size,
+                    'limit': shard.limit,
+                    'weight': shard.total_weight,
+                    'max_weight': shard.max_weight,
+                })
+        totals = {name: sum(shard[name] for shard in shards)
+                  for name in ('hits', 'misses', 'evictions', 'expirations',
+                               'rejections', 'size', 'weight')}
+        totals['limit'] = self.limit
+        totals['max_weight'] = self.max_weight
+        totals['shards'] = shards
+        return totals
+
+
+def _split(total, count):
+    """Splits total into count near-equal parts, or count Nones if
+    total is None"""
+    if total is None:
+        return [None] * count
+    base, extra = divmod(total, count)
+    return [base + (i < extra) for i in range(count)]
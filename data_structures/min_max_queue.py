@@ -0,0 +1,45 @@
+"""Implement a queue with O(1) min and max"""
+from .dll_stack import MinMaxStack
+from .doubly_linked_list import DoublyLinkedList
+
+
+class MinMaxQueue:
+    """A first-in, first-out queue that can report its smallest and
+    largest values in O(1), which makes sliding-window minimums and
+    maximums linear overall: enqueue each new value and dequeue the
+    one falling out of the window.
+
+    It is built from two MinMaxStacks. New values are pushed onto
+    inbox; dequeue pops from outbox, first moving everything over
+    from inbox if outbox is empty. Each value is moved once, so
+    dequeue is O(1) amortized."""
+
+    def __init__(self, engine=DoublyLinkedList):
+        self.inbox = MinMaxStack(engine)
+        self.outbox = MinMaxStack(engine)
+
+    def enqueue(self, value):
+        self.inbox.push(value)
+
+    def dequeue(self):
+        if self.outbox.len() == 0:
+            # reversing inbox onto outbox puts the oldest on top
+            while self.inbox.len():
+                self.outbox.push(self.inbox.pop())
+        return self.outbox.pop()
+
+    def len(self):
+        return self.inbox.len() + self.outbox.len()
+
+    def get_min(self):
+        return self._combine(min, self.inbox.get_min(), self.outbox.get_min())
+
+    def get_max(self):
+        return self._combine(max, self.inbox.get_max(), self.outbox.get_max())
+
+    def _combine(self, pick, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return pick(a, b)
@@ -0,0 +1,30 @@
+"""Implement a priority queue on a heap"""
+from .generic_heap import Heap
+
+
+def _comes_first(a, b):
+    # entries are (priority, sequence number, value); the sequence
+    # number breaks ties, so values are never compared
+    return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])
+
+
+class PriorityQueue:
+    """A queue that dequeues the value with the lowest priority
+    number first, and values with equal priority in the order they
+    were enqueued. It is backed by a Heap, so enqueue and dequeue are
+    O(log n)."""
+
+    def __init__(self):
+        self.storage = Heap(_comes_first)
+        self.count = 0
+
+    def enqueue(self, value, priority=0):
+        self.storage.insert((priority, self.count, value))
+        self.count += 1
+
+    def dequeue(self):
+        entry = self.storage.delete()
+        return None if entry is None else entry[2]
+
+    def len(self):
+        return self.storage.get_size()
@@ -0,0 +1,95 @@
+"""Implement a growable circular buffer"""
+
+
+class RingBuffer:
+    """A double-ended buffer stored in one contiguous Python list
+    used as a ring. The capacity is always a power of two so that
+    wrapping an index is a single bitwise and. The buffer doubles
+    when it fills up and halves once it drops to a quarter full,
+    but never below min_capacity.
+
+    It has the same add/remove methods and length attribute as
+    DoublyLinkedList, so Queue and Stack can use it as their
+    storage engine."""
+
+    def __init__(self, min_capacity=8):
+        capacity = 1
+        while capacity < min_capacity:
+            capacity *= 2
+        self.min_capacity = capacity
+        self.buffer = [None] * capacity
+        self.mask = capacity - 1
+        # slot holding the head value
+        self.start = 0
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        buffer = self.buffer
+        mask = self.mask
+        for i in range(self.start, self.start + self.length):
+            yield buffer[i & mask]
+
+    @property
+    def capacity(self):
+        return self.mask + 1
+
+    def add_to_head(self, value):
+        """Stores value in the slot before the current head"""
+        if self.length > self.mask:
+            self._resize(2 * (self.mask + 1))
+        self.start = (self.start - 1) & self.mask
+        self.buffer[self.start] = value
+        self.length += 1
+
+    def add_to_tail(self, value):
+        """Stores value in the slot after the current tail"""
+        if self.length > self.mask:
+            self._resize(2 * (self.mask + 1))
+        self.buffer[(self.start + self.length) & self.mask] = value
+        self.length += 1
+
+    def remove_from_head(self):
+        """Removes and returns the head value, or None if empty"""
+        if not self.length:
+            return
+        value = self.buffer[self.start]
+        # drop the reference so the value can be collected
+        self.buffer[self.start] = None
+        self.start = (self.start + 1) & self.mask
+        self.length -= 1
+        self._maybe_shrink()
+        return value
+
+    def remove_from_tail(self):
+        """Removes and returns the tail value, or None if empty"""
+        if not self.length:
+            return
+        self.length -= 1
+        index = (self.start + self.length) & self.mask
+        value = self.buffer[index]
+        self.buffer[index] = None
+        self._maybe_shrink()
+        return value
+
+    def _maybe_shrink(self):
+        """Halves the buffer once it is only a quarter full"""
+        capacity = self.mask + 1
+        if capacity > self.min_capacity and self.length <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def _resize(self, capacity):
+        """Copies the values, in order, into a new buffer of the
+        given capacity starting at slot 0"""
+        end = self.start + self.length
+        old_capacity = self.mask + 1
+        if end <= old_capacity:
+            values = self.buffer[self.start:end]
+        else:
+            values = self.buffer[self.start:] + self.buffer[:end - old_capacity]
+
+        self.buffer = values + [None] * (capacity - self.length)
+        self.mask = capacity - 1
+        self.start = 0
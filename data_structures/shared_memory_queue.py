@@ -0,0 +1,154 @@
+"""Implement a multi-process queue over shared memory"""
+import multiprocessing
+import struct
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from queue import Empty, Full
+
+# the block starts with two counters, the number of records ever
+# read (head) and ever written (tail), followed by the slots
+_COUNTER = struct.Struct('Q')
+_HEAD = 0
+_TAIL = _COUNTER.size
+_SLOTS = 2 * _COUNTER.size
+
+
+class SharedMemoryQueue:
+    """A bounded first-in, first-out queue of fixed-width records
+    that several processes can use at once without pickling
+    anything. The records live in a ring of capacity slots inside one
+    multiprocessing.shared_memory block.
+
+    Pass fmt to store struct records (enqueue takes a tuple, or a
+    single value if fmt has one field, and dequeue gives the same
+    back), or slot_size to store raw bytes of exactly that length.
+
+    Two semaphores count the free and filled slots, so a producer
+    never touches a slot a consumer is reading and the other way
+    round. Producers share one lock and consumers another, so
+    writes and reads can happen at the same time. Hand the queue to
+    a child process as a Process argument and the child attaches to
+    the same block."""
+
+    def __init__(self, capacity, fmt=None, slot_size=None, name=None,
+                 ctx=multiprocessing):
+        if (fmt is None) == (slot_size is None):
+            raise ValueError('pass exactly one of fmt and slot_size')
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+
+        self.fmt = fmt
+        self.record = None if fmt is None else struct.Struct(fmt)
+        self.slot_size = slot_size if fmt is None else self.record.size
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_SLOTS + capacity * self.slot_size)
+        self.owner = True
+        _COUNTER.pack_into(self.shm.buf, _HEAD, 0)
+        _COUNTER.pack_into(self.shm.buf, _TAIL, 0)
+
+        self.put_lock = ctx.Lock()
+        self.get_lock = ctx.Lock()
+        self.free_slots = ctx.Semaphore(capacity)
+        self.filled_slots = ctx.Semaphore(0)
+
+    def __getstate__(self):
+        # a child process attaches to the block by name
+        state = self.__dict__.copy()
+        state['shm'] = self.shm.name
+        state['owner'] = False
+        del state['record']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.record = None if self.fmt is None else struct.Struct(self.fmt)
+        self.shm = shared_memory.SharedMemory(name=state['shm'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def enqueue(self, value, block=True, timeout=None):
+        """Copies value into the next free slot, waiting for one if
+        the queue is full. Raises queue.Full if none frees up in
+        time."""
+        if self.record is None and len(value) != self.slot_size:
+            raise ValueError(f'records must be {self.slot_size} bytes')
+        if not self.free_slots.acquire(block, timeout):
+            raise Full
+
+        try:
+            with self.put_lock:
+                buf = self.shm.buf
+                tail = _COUNTER.unpack_from(buf, _TAIL)[0]
+                offset = self._offset(tail)
+                # write straight into shared memory, no temporary bytes
+                if self.record is None:
+                    buf[offset:offset + self.slot_size] = value
+                elif isinstance(value, tuple):
+                    self.record.pack_into(buf, offset, *value)
+                else:
+                    self.record.pack_into(buf, offset, value)
+                _COUNTER.pack_into(buf, _TAIL, tail + 1)
+        except BaseException:
+            # nothing was written, so give the slot back
+            self.free_slots.release()
+            raise
+        self.filled_slots.release()
+
+    def dequeue(self, block=True, timeout=None):
+        """Removes and returns the record at the front of the queue,
+        waiting for one if the queue is empty. Raises queue.Empty if
+        none arrives in time."""
+        with self.read(block, timeout) as view:
+            if self.record is None:
+                return bytes(view)
+            values = self.record.unpack_from(view)
+            return values[0] if len(values) == 1 else values
+
+    @contextmanager
+    def read(self, block=True, timeout=None):
+        """Yields a memoryview of the record at the front of the queue
+        without copying it, then removes the record when the block
+        ends. Other consumers wait until then, so keep the block
+        short and don't keep the view."""
+        if not self.filled_slots.acquire(block, timeout):
+            raise Empty
+
+        try:
+            with self.get_lock:
+                buf = self.shm.buf
+                head = _COUNTER.unpack_from(buf, _HEAD)[0]
+                offset = self._offset(head)
+                view = buf[offset:offset + self.slot_size]
+                try:
+                    yield view
+                finally:
+                    view.release()
+                    _COUNTER.pack_into(buf, _HEAD, head + 1)
+        finally:
+            self.free_slots.release()
+
+    def len(self):
+        """Returns the number of records waiting. Other processes may
+        change it straight away."""
+        buf = self.shm.buf
+        return (_COUNTER.unpack_from(buf, _TAIL)[0]
+                - _COUNTER.unpack_from(buf, _HEAD)[0])
+
+    def close(self):
+        """Detaches this process from the shared memory"""
+        self.shm.close()
+
+    def unlink(self):
+        """Frees the shared memory. Call it once, from the process that
+        created the queue, after every process has closed it."""
+        self.shm.unlink()
+
+    def _offset(self, count):
+        return _SLOTS + (count % self.capacity) * self.slot_size
@@ -0,0 +1,125 @@
+"""Implement a queue that spills its middle to disk"""
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from collections import deque
+
+from .dll_queue import Queue
+from .doubly_linked_list import DoublyLinkedList
+
+
+class SpillingQueue(Queue):
+    """A Queue whose memory use stays flat however long it gets.
+
+    At most window values are held in memory at each end: the front
+    of the queue lives in storage, as in Queue, and newly enqueued
+    values collect in a back buffer. Whenever the back buffer fills
+    up it is pickled to a segment file in directory and emptied.
+    Without a directory, a temporary one is made at the first spill. Once storage runs dry it is
+    refilled from the oldest segment, read through mmap, and that
+    segment's file is deleted. While nothing has spilled, values go
+    straight into storage and no file is touched.
+
+    Values must be picklable. Call close(), or use the queue as a
+    context manager, to delete any segments still on disk; a queue
+    that is garbage collected first deletes them then."""
+
+    def __init__(self, window=10000, directory=None, engine=DoublyLinkedList):
+        super().__init__(engine)
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        self.window = window
+        self.owns_directory = directory is None
+        self.directory = directory
+        # newest values, not yet written to a segment
+        self.back = []
+        # (path, value count) of every segment, oldest first
+        self.segments = deque()
+        self.spilled = 0
+        self.segment_number = 0
+        # the temporary directory, once _spill has made it
+        self.made_directories = []
+        self._finalizer = weakref.finalize(
+            self, _delete_spill_files, self.segments, self.made_directories)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def enqueue(self, value):
+        # nothing is queued behind storage yet, so it can go there
+        if not self.segments and not self.back \
+                and self.storage.length < self.window:
+            self.storage.add_to_head(value)
+            return
+
+        self.back.append(value)
+        if len(self.back) >= self.window:
+            self._spill()
+
+    def dequeue(self):
+        if self.storage.length == 0:
+            self._refill()
+        return self.storage.remove_from_tail()
+
+    def len(self):
+        return self.storage.length + self.spilled + len(self.back)
+
+    def close(self):
+        """Deletes every segment file, and the directory if the queue
+        made it. Anything still queued is lost."""
+        _delete_spill_files(self.segments, self.made_directories)
+        self.spilled = 0
+
+    def _spill(self):
+        """Writes the back buffer to a new segment file"""
+        if self.owns_directory and not self.made_directories:
+            self.directory = tempfile.mkdtemp(prefix='queue-spill-')
+            self.made_directories.append(self.directory)
+        path = os.path.join(self.directory, f'{self.segment_number:08d}.seg')
+        self.segment_number += 1
+
+        with open(path, 'wb') as f:
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            for value in self.back:
+                pickler.dump(value)
+
+        self.segments.append((path, len(self.back)))
+        self.spilled += len(self.back)
+        self.back = []
+
+    def _refill(self):
+        """Moves the oldest values not in storage into it"""
+        if self.segments:
+            path, count = self.segments.popleft()
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # mmap has the read/readline an Unpickler needs
+                unpickler = pickle.Unpickler(mm)
+                for _ in range(count):
+                    self.storage.add_to_head(unpickler.load())
+            os.remove(path)
+            self.spilled -= count
+        elif self.back:
+            for value in self.back:
+                self.storage.add_to_head(value)
+            self.back = []
+
+
+def _delete_spill_files(segments, directories):
+    """Deletes the segment files and the directories a SpillingQueue
+    made. Takes them rather than the queue so that weakref.finalize
+    can hold on to them without keeping the queue alive."""
+    for path, _ in segments:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    segments.clear()
+    while directories:
+        shutil.rmtree(directories.pop(), ignore_errors=True)
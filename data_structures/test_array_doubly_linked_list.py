@@ -0,0 +1,91 @@
+import unittest
+import pickle
+from data_structures.array_doubly_linked_list import ArrayDoublyLinkedList, NIL
+
+
+class ArrayDoublyLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.dll = ArrayDoublyLinkedList()
+
+    def values(self):
+        out = []
+        curr = self.dll.head
+        while curr != NIL:
+            out.append(self.dll.value(curr))
+            curr = self.dll.next[curr]
+        return out
+
+    def test_empty_list(self):
+        self.assertEqual(len(self.dll), 0)
+        self.assertEqual(self.dll.head, NIL)
+        self.assertEqual(self.dll.tail, NIL)
+        self.assertIsNone(self.dll.remove_from_head())
+        self.assertIsNone(self.dll.remove_from_tail())
+        self.assertIsNone(self.dll.get_max())
+        self.assertEqual(str(self.dll), 'empty')
+
+    def test_add_and_remove(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_head(1)
+        self.dll.add_to_tail(3)
+        self.assertEqual(self.values(), [1, 2, 3])
+        self.assertEqual(len(self.dll), 3)
+
+        self.assertEqual(self.dll.remove_from_head(), 1)
+        self.assertEqual(self.dll.remove_from_tail(), 3)
+        self.assertEqual(self.values(), [2])
+        self.assertEqual(self.dll.remove_from_tail(), 2)
+        self.assertEqual(self.dll.head, NIL)
+        self.assertEqual(self.dll.tail, NIL)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_moves_keep_handles(self):
+        a = self.dll.add_to_tail('a')
+        b = self.dll.add_to_tail('b')
+        c = self.dll.add_to_tail('c')
+
+        self.dll.move_to_end(a)
+        self.assertEqual(self.values(), ['b', 'c', 'a'])
+        self.assertEqual(self.dll.tail, a)
+
+        self.dll.move_to_front(c)
+        self.assertEqual(self.values(), ['c', 'b', 'a'])
+        self.assertEqual(self.dll.head, c)
+
+        self.dll.move_to_end(b)
+        self.assertEqual(self.values(), ['c', 'a', 'b'])
+        self.assertEqual(len(self.dll), 3)
+
+    def test_delete_reuses_slots(self):
+        self.dll.add_to_tail(1)
+        middle = self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+
+        self.assertEqual(self.dll.delete(middle), 2)
+        self.assertEqual(self.values(), [1, 3])
+
+        handle = self.dll.add_to_head(4)
+        self.assertEqual(handle, middle)
+        self.assertEqual(self.values(), [4, 1, 3])
+        self.assertEqual(len(self.dll.values), 3)
+
+    def test_get_max_and_find_middle(self):
+        for value in [5, 100, 55, 101, 7]:
+            self.dll.add_to_tail(value)
+        self.assertEqual(self.dll.get_max(), 101)
+        self.assertEqual(self.dll.find_middle(), 55)
+        self.dll.add_to_tail(8)
+        self.assertEqual(self.dll.find_middle(), 55)
+
+    def test_pickle_round_trip(self):
+        for value in range(10):
+            self.dll.add_to_tail(value)
+        self.dll.remove_from_head()
+        copy = pickle.loads(pickle.dumps(self.dll))
+        self.assertEqual(copy.head, self.dll.head)
+        self.assertEqual(len(copy), 9)
+        self.assertEqual(str(copy), str(self.dll))
+
+
+if __name__ == '__main__':
+    unittest.main()
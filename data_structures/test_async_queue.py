@@ -0,0 +1,132 @@
+import unittest
+import asyncio
+from data_structures.async_queue import AsyncQueue, AsyncStack
+from data_structures.ring_buffer import RingBuffer
+
+
+class AsyncQueueTests(unittest.IsolatedAsyncioTestCase):
+    engine = None
+
+    def make(self, cls=AsyncQueue, maxsize=0):
+        if self.engine is None:
+            return cls(maxsize)
+        return cls(maxsize, engine=self.engine)
+
+    async def test_fifo_order(self):
+        q = self.make()
+        await q.enqueue(1)
+        await q.enqueue(2)
+        self.assertEqual(q.len(), 2)
+        self.assertEqual(await q.dequeue(), 1)
+        self.assertEqual(await q.dequeue(), 2)
+        self.assertEqual(q.len(), 0)
+
+    async def test_stack_lifo_order(self):
+        s = self.make(AsyncStack)
+        for value in range(3):
+            await s.push(value)
+        self.assertEqual(await s.pop(), 2)
+        self.assertEqual(await s.pop_batch(5), [1, 0])
+
+    async def test_nowait(self):
+        q = self.make(maxsize=1)
+        with self.assertRaises(asyncio.QueueEmpty):
+            q.dequeue_nowait()
+        q.enqueue_nowait(1)
+        with self.assertRaises(asyncio.QueueFull):
+            q.enqueue_nowait(2)
+        self.assertEqual(q.dequeue_nowait(), 1)
+
+    async def test_dequeue_waits_for_item(self):
+        q = self.make()
+        task = asyncio.create_task(q.dequeue())
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        await q.enqueue('x')
+        self.assertEqual(await task, 'x')
+
+    async def test_backpressure(self):
+        q = self.make(maxsize=2)
+        await q.enqueue(1)
+        await q.enqueue(2)
+        task = asyncio.create_task(q.enqueue(3))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        self.assertEqual(await q.dequeue(), 1)
+        await task
+        self.assertEqual(await q.dequeue_batch(10), [2, 3])
+
+    async def test_dequeue_batch_timeout(self):
+        q = self.make()
+        self.assertEqual(await q.dequeue_batch(5, timeout=0.01), [])
+        self.assertEqual(len(q._getters), 0)
+        for value in range(10):
+            await q.enqueue(value)
+        self.assertEqual(await q.dequeue_batch(4), [0, 1, 2, 3])
+        self.assertEqual(q.len(), 6)
+
+    async def test_dequeue_batch_keeps_waiting_if_item_is_taken(self):
+        q = self.make()
+        batch = asyncio.create_task(q.dequeue_batch(10, timeout=5))
+        await asyncio.sleep(0)
+
+        # another consumer takes the item before the batch resumes
+        q.enqueue_nowait(1)
+        await asyncio.sleep(0)
+        self.assertEqual(q.dequeue_nowait(), 1)
+        await asyncio.sleep(0.01)
+        self.assertFalse(batch.done())
+
+        q.enqueue_nowait(2)
+        self.assertEqual(await batch, [2])
+
+    async def test_cancelled_getter_passes_item_on(self):
+        q = self.make()
+        first = asyncio.create_task(q.dequeue())
+        second = asyncio.create_task(q.dequeue())
+        await asyncio.sleep(0)
+
+        # wake the first getter, then cancel it before it runs
+        q.enqueue_nowait('x')
+        first.cancel()
+        self.assertEqual(await second, 'x')
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_cancelled_putter_is_forgotten(self):
+        q = self.make(maxsize=1)
+        await q.enqueue(1)
+        task = asyncio.create_task(q.enqueue(2))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(len(q._putters), 0)
+        self.assertEqual(await q.dequeue_batch(5), [1])
+
+    async def test_many_producers_and_consumers(self):
+        q = self.make(maxsize=16)
+        received = []
+
+        async def produce(start):
+            for value in range(start, start + 500):
+                await q.enqueue(value)
+
+        async def consume():
+            while True:
+                batch = await q.dequeue_batch(8, timeout=0.1)
+                if not batch:
+                    return
+                received.extend(batch)
+
+        await asyncio.gather(*[produce(i * 500) for i in range(4)],
+                             *[consume() for _ in range(3)])
+        self.assertEqual(sorted(received), list(range(2000)))
+
+
+class RingBufferAsyncQueueTests(AsyncQueueTests):
+    engine = RingBuffer
+
+
+if __name__ == '__main__':
+    unittest.main()
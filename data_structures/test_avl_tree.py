@@ -1,6 +1,6 @@
 import unittest
-from avl_tree import AVLTree
-from avl_tree import Node
+from data_structures.avl_tree import AVLTree
+from data_structures.avl_tree import Node
 
 class AVLTreeTests(unittest.TestCase):
   def setUp(self):
@@ -0,0 +1,45 @@
+import unittest
+import json
+import os
+import tempfile
+from data_structures.benchmark import run_benchmarks, compare, main, SUBJECTS
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_run_benchmarks_covers_every_operation(self):
+        results = run_benchmarks(sizes=[50], repeat=1)
+        timed = {(t['subject'], t['op']) for t in results['timings']}
+        expected = {(subject, op) for subject, ops in SUBJECTS.items()
+                    for op in ops}
+        self.assertEqual(timed, expected)
+        for entry in results['timings']:
+            self.assertEqual(entry['size'], 50)
+            self.assertGreater(entry['ops_per_sec'], 0)
+        self.assertEqual(len(results['memory']), len(SUBJECTS))
+        for entry in results['memory']:
+            self.assertGreater(entry['bytes_per_element'], 0)
+
+    def test_compare(self):
+        old = run_benchmarks(sizes=[20], subjects=['deque'], repeat=1,
+                             memory=False)
+        new = run_benchmarks(sizes=[20], subjects=['deque', 'list'], repeat=1,
+                             memory=False)
+        rows = compare(old, new)
+        self.assertEqual(len(rows), len(SUBJECTS['deque']))
+        for subject, op, size, before, after, ratio in rows:
+            self.assertEqual(subject, 'deque')
+            self.assertAlmostEqual(ratio, after / before)
+
+    def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'results.json')
+            main(['--sizes', '10', '--subjects', 'Queue', 'Stack',
+                  '--repeat', '1', '--no-memory', '--output', path])
+            with open(path) as f:
+                results = json.load(f)
+        self.assertEqual(len(results['timings']), 4)
+        self.assertEqual(results['memory'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import threading
+import time
+from queue import Empty, Full
+from data_structures.blocking_queue import BlockingQueue
+from data_structures.ring_buffer import RingBuffer
+
+
+class BlockingQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = BlockingQueue(maxsize=3)
+
+    def test_fifo_order(self):
+        self.q.enqueue(1)
+        self.q.enqueue(2)
+        self.assertEqual(self.q.len(), 2)
+        self.assertEqual(self.q.dequeue(), 1)
+        self.assertEqual(self.q.dequeue(), 2)
+        self.assertEqual(self.q.len(), 0)
+
+    def test_non_blocking_and_timeouts(self):
+        with self.assertRaises(Empty):
+            self.q.dequeue(block=False)
+        with self.assertRaises(Empty):
+            self.q.dequeue(timeout=0.01)
+
+        for value in range(3):
+            self.q.enqueue(value)
+        with self.assertRaises(Full):
+            self.q.enqueue(3, block=False)
+        with self.assertRaises(Full):
+            self.q.enqueue(3, timeout=0.01)
+        self.assertEqual(self.q.len(), 3)
+
+    def test_enqueue_waits_for_room(self):
+        for value in range(3):
+            self.q.enqueue(value)
+
+        def consume():
+            time.sleep(0.05)
+            self.q.dequeue()
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        self.q.enqueue(3, timeout=5)
+        thread.join()
+        self.assertEqual(self.q.get_batch(10), [1, 2, 3])
+
+    def test_put_many_and_get_batch(self):
+        q = BlockingQueue()
+        q.put_many(range(10))
+        self.assertEqual(q.get_batch(4), [0, 1, 2, 3])
+        self.assertEqual(q.get_batch(100), [4, 5, 6, 7, 8, 9])
+        self.assertEqual(q.get_batch(5, timeout=0.01), [])
+
+    def test_put_many_respects_maxsize(self):
+        with self.assertRaises(Full):
+            self.q.put_many(range(5), timeout=0.01)
+        self.assertEqual(self.q.len(), 3)
+        self.assertEqual(self.q.get_batch(10), [0, 1, 2])
+
+    def test_many_producers_and_consumers(self):
+        q = BlockingQueue(maxsize=50, engine=RingBuffer)
+        received = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for chunk in range(start, start + 1000, 10):
+                q.put_many(range(chunk, chunk + 10))
+
+        def consume():
+            while True:
+                batch = q.get_batch(32, timeout=0.5)
+                if not batch:
+                    return
+                with lock:
+                    received.extend(batch)
+
+        producers = [threading.Thread(target=produce, args=(i * 1000,))
+                     for i in range(4)]
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers + consumers:
+            thread.join()
+
+        self.assertEqual(sorted(received), list(range(4000)))
+        self.assertEqual(q.len(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
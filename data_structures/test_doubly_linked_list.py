@@ -0,0 +1,657 @@
+import unittest
+import io
+import random
+from data_structures.doubly_linked_list import ListNode
+from data_structures.doubly_linked_list import DoublyLinkedList
+
+
+class DoublyLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.node = ListNode(1)
+        self.dll = DoublyLinkedList(self.node)
+
+    def test_list_remove_from_tail(self):
+        self.dll.remove_from_tail()
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(33)
+        self.assertEqual(self.dll.head.value, 33)
+        self.assertEqual(self.dll.tail.value, 33)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_from_tail(), 33)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(68)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_from_tail(), 68)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_list_remove_from_head(self):
+        self.dll.remove_from_head()
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_head(2)
+        self.assertEqual(self.dll.head.value, 2)
+        self.assertEqual(self.dll.tail.value, 2)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_from_head(), 2)
+        self.assertEqual(len(self.dll), 0)
+        
+        self.dll.add_to_head(55)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_from_head(), 55)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_list_add_to_tail(self):
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(len(self.dll), 1)
+
+        self.dll.add_to_tail(30)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(self.dll.tail.value, 30)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_tail(20)
+        self.assertEqual(self.dll.tail.prev.value, 30)
+        self.assertEqual(self.dll.tail.value, 20)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_node_delete(self):
+        node_1 = ListNode(3)
+        node_2 = ListNode(4)
+        node_3 = ListNode(5)
+
+        node_1.next = node_2
+        node_2.next = node_3
+        node_2.prev = node_1
+        node_3.prev = node_2
+
+        node_2.delete()
+
+        self.assertEqual(node_1.next, node_3)
+        self.assertEqual(node_3.prev, node_1)
+
+    def test_node_insert_before(self):
+        self.node.insert_before(0)
+        self.assertEqual(self.node.prev.value, 0)
+
+    def test_list_add_to_head(self):
+        self.assertEqual(self.dll.head.value, 1)
+
+        self.dll.add_to_head(10)
+        self.assertEqual(self.dll.head.value, 10)
+        self.assertEqual(self.dll.head.next.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+    def test_node_insert_after(self):
+        self.node.insert_after(2)
+        self.assertEqual(self.node.next.value, 2)
+
+    def test_list_move_to_end(self):
+        self.dll.add_to_head(40)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(self.dll.head.value, 40)
+
+        self.dll.move_to_end(self.dll.head)
+        self.assertEqual(self.dll.tail.value, 40)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_tail(4)
+        self.dll.move_to_end(self.dll.head.next)
+        self.assertEqual(self.dll.tail.value, 40)
+        self.assertEqual(self.dll.tail.prev.value, 4)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_list_move_to_front(self):
+        self.dll.add_to_tail(3)
+        self.assertEqual(self.dll.head.value, 1)
+        self.assertEqual(self.dll.tail.value, 3)
+
+        self.dll.move_to_front(self.dll.tail)
+        self.assertEqual(self.dll.head.value, 3)
+        self.assertEqual(self.dll.head.next.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_head(29)
+        self.dll.move_to_front(self.dll.head.next)
+        self.assertEqual(self.dll.head.value, 3)
+        self.assertEqual(self.dll.head.next.value, 29)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_list_delete(self):
+        self.dll.delete(self.node)
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(1)
+        self.dll.add_to_head(9)
+        self.dll.add_to_tail(6)
+
+        self.dll.delete(self.dll.head)
+        self.assertEqual(self.dll.head.value, 1)
+        self.assertEqual(self.dll.tail.value, 6)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.delete(self.dll.head)
+        self.assertEqual(self.dll.head.value, 6)
+        self.assertEqual(self.dll.tail.value, 6)
+        self.assertEqual(len(self.dll), 1)
+
+    def test_get_max(self):
+        self.assertEqual(self.dll.get_max(), 1)
+        self.dll.add_to_tail(100)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_tail(55)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_tail(101)
+        self.assertEqual(self.dll.get_max(), 101)
+
+    def test_move_keeps_node_identity(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        node = self.dll.head.next
+
+        self.dll.move_to_end(node)
+        self.assertIs(self.dll.tail, node)
+        self.assertEqual(self.dll.tail.prev.value, 3)
+        self.assertIsNone(node.next)
+
+        self.dll.move_to_front(node)
+        self.assertIs(self.dll.head, node)
+        self.assertEqual(self.dll.head.next.value, 1)
+        self.assertIsNone(node.prev)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_splice(self):
+        other = DoublyLinkedList()
+        other.add_to_tail(2)
+        other.add_to_tail(3)
+        other_head = other.head
+
+        self.dll.splice(other)
+        self.assertIs(self.dll.head.next, other_head)
+        self.assertEqual(self.dll.tail.value, 3)
+        self.assertEqual(len(self.dll), 3)
+        self.assertIsNone(other.head)
+        self.assertIsNone(other.tail)
+        self.assertEqual(len(other), 0)
+
+        empty = DoublyLinkedList()
+        empty.splice(self.dll)
+        self.assertEqual(empty.head.value, 1)
+        self.assertEqual(empty.tail.value, 3)
+        self.assertEqual(len(empty), 3)
+
+    def test_split_at(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.dll.add_to_tail(4)
+        node = self.dll.head.next.next
+
+        rest = self.dll.split_at(node)
+        self.assertIs(rest.head, node)
+        self.assertEqual(rest.tail.value, 4)
+        self.assertIsNone(node.prev)
+        self.assertEqual(len(rest), 2)
+        self.assertEqual(self.dll.tail.value, 2)
+        self.assertIsNone(self.dll.tail.next)
+        self.assertEqual(len(self.dll), 2)
+
+        rest = self.dll.split_at(self.dll.head)
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+        self.assertEqual(len(rest), 2)
+
+    def test_move_range(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.dll.add_to_tail(4)
+        first = self.dll.head.next
+        last = first.next
+
+        dest = DoublyLinkedList()
+        dest.add_to_tail(10)
+        self.dll.move_range(first, last, dest)
+        self.assertEqual(self.dll.head.next.value, 4)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(len(self.dll), 2)
+        self.assertIs(dest.head.next, first)
+        self.assertIs(dest.tail, last)
+        self.assertEqual(len(dest), 3)
+
+        self.dll.move_range(self.dll.head, self.dll.head, self.dll)
+        self.assertEqual(self.dll.head.value, 4)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+    def test_node_has_no_dict(self):
+        self.assertFalse(hasattr(self.node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.node.extra = 1
+
+    def test_node_pool_reuses_nodes(self):
+        dll = DoublyLinkedList(pool_size=2)
+        dll.add_to_tail(1)
+        dll.add_to_tail(2)
+        dll.add_to_tail(3)
+        head = dll.head
+        middle = dll.head.next
+        tail = dll.tail
+
+        self.assertEqual(dll.remove_from_head(), 1)
+        dll.delete(middle)
+        self.assertEqual(dll.remove_from_tail(), 3)
+        self.assertEqual(len(dll._pool), 2)
+        self.assertIsNone(middle.value)
+        self.assertIsNone(middle.prev)
+
+        dll.add_to_head(4)
+        dll.add_to_tail(5)
+        dll.add_to_tail(6)
+        self.assertIs(dll.head, middle)
+        self.assertIs(dll.head.next, head)
+        self.assertIsNot(dll.tail, tail)
+        self.assertEqual(dll.head.value, 4)
+        self.assertEqual(dll.head.next.value, 5)
+        self.assertEqual(dll.tail.value, 6)
+        self.assertEqual(len(dll._pool), 0)
+        self.assertEqual(len(dll), 3)
+
+    def test_no_pool_by_default(self):
+        self.dll.remove_from_head()
+        self.assertEqual(len(self.dll._pool), 0)
+        self.assertEqual(self.node.value, 1)
+
+    def test_iteration(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.assertEqual(list(self.dll), [1, 2, 3])
+        self.assertEqual(list(reversed(self.dll)), [3, 2, 1])
+        self.assertEqual(list(DoublyLinkedList()), [])
+
+    def test_delete_while_iterating(self):
+        for value in range(2, 6):
+            self.dll.add_to_tail(value)
+        seen = []
+        for value in self.dll:
+            seen.append(value)
+            self.dll.delete(self.dll.head)
+        self.assertEqual(seen, [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.dll), 0)
+
+    def test_iter_from(self):
+        for value in range(2, 7):
+            self.dll.add_to_tail(value)
+        node = self.dll.head.next
+        self.assertEqual(list(self.dll.iter_from(node, 3)), [2, 3, 4])
+        self.assertEqual(list(self.dll.iter_from(node)), [2, 3, 4, 5, 6])
+        self.assertEqual(list(self.dll.iter_from(node, 5, reverse=True)),
+                         [2, 1])
+        self.assertEqual(list(self.dll.iter_from(node, 0)), [])
+
+    def test_str_and_write_to(self):
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.assertEqual(str(self.dll), '( 1 ) <-> ( 2 ) <-> ( 3 ) <-> ')
+
+        out = io.StringIO()
+        self.dll.write_to(out, chunk_size=2)
+        self.assertEqual(out.getvalue(), str(self.dll))
+
+        out = io.StringIO()
+        DoublyLinkedList().write_to(out)
+        self.assertEqual(out.getvalue(), 'empty')
+
+    def test_tracked_aggregates(self):
+        dll = DoublyLinkedList(track_aggregates=True)
+        self.assertIsNone(dll.get_max())
+        self.assertIsNone(dll.get_min())
+        self.assertEqual(dll.get_sum(), 0)
+
+        for value in [5, 100, 55]:
+            dll.add_to_tail(value)
+        dll.add_to_head(1)
+        self.assertEqual(dll.get_max(), 100)
+        self.assertEqual(dll.get_min(), 1)
+        self.assertEqual(dll.get_sum(), 161)
+        self.assertFalse(dll._stale)
+
+        dll.delete(dll.head.next)
+        self.assertFalse(dll._stale)
+        self.assertEqual(dll.get_sum(), 156)
+
+        dll.delete(dll.head.next)
+        self.assertTrue(dll._stale)
+        self.assertEqual(dll.get_max(), 55)
+        self.assertEqual(dll.remove_from_head(), 1)
+        self.assertEqual(dll.get_min(), 55)
+        dll.move_to_front(dll.tail)
+        self.assertEqual(dll.get_max(), 55)
+        self.assertEqual(dll.remove_from_tail(), 55)
+        self.assertIsNone(dll.get_max())
+        self.assertEqual(dll.get_sum(), 0)
+
+    def test_aggregates_match_scan(self):
+        dll = DoublyLinkedList(track_aggregates=True)
+        for value in [3, 9, 2, 9, 7, 1, 8]:
+            dll.add_to_tail(value)
+        while len(dll) > 0:
+            self.assertEqual(dll.get_max(), max(dll))
+            self.assertEqual(dll.get_min(), min(dll))
+            self.assertEqual(dll.get_sum(), sum(dll))
+            dll.remove_from_head()
+
+    def test_aggregates_after_splice_and_split(self):
+        dll = DoublyLinkedList(track_aggregates=True)
+        other = DoublyLinkedList(track_aggregates=True)
+        for value in [4, 6]:
+            dll.add_to_tail(value)
+        for value in [1, 10]:
+            other.add_to_tail(value)
+
+        dll.splice(other)
+        self.assertFalse(dll._stale)
+        self.assertEqual(dll.get_max(), 10)
+        self.assertEqual(dll.get_min(), 1)
+        self.assertEqual(dll.get_sum(), 21)
+        self.assertIsNone(other.get_max())
+
+        rest = dll.split_at(dll.tail.prev)
+        self.assertEqual(dll.get_max(), 6)
+        self.assertEqual(dll.get_sum(), 10)
+        self.assertEqual(rest.get_min(), 1)
+        self.assertEqual(rest.get_sum(), 11)
+
+        # moving everything out leaves the empty-list aggregates
+        everything = dll.split_at(dll.head)
+        self.assertEqual(dll.get_sum(), 0)
+        self.assertIsNone(dll.get_max())
+        self.assertIsNone(dll.get_min())
+        self.assertEqual(everything.get_sum(), 10)
+
+        rest.move_range(rest.head, rest.tail, everything)
+        self.assertEqual(rest.get_sum(), 0)
+        self.assertIsNone(rest.get_max())
+        self.assertIsNone(rest.get_min())
+        self.assertEqual(everything.get_sum(), 21)
+        self.assertEqual(everything.get_max(), 10)
+
+    def test_untracked_min_and_sum(self):
+        self.dll.add_to_tail(7)
+        self.dll.add_to_tail(-2)
+        self.assertEqual(self.dll.get_min(), -2)
+        self.assertEqual(self.dll.get_sum(), 6)
+
+    def test_positional_access(self):
+        for value in range(2, 7):
+            self.dll.add_to_tail(value)
+        self.assertEqual(self.dll.get(0), 1)
+        self.assertEqual(self.dll.get(4), 5)
+        self.assertEqual(self.dll.get(-1), 6)
+        with self.assertRaises(IndexError):
+            self.dll.get(6)
+
+        self.dll.insert_at(2, 'x')
+        self.assertEqual(list(self.dll), [1, 2, 'x', 3, 4, 5, 6])
+        self.assertEqual(self.dll.delete_at(2), 'x')
+        self.assertEqual(self.dll.delete_at(-1), 6)
+        self.assertEqual(list(self.dll), [1, 2, 3, 4, 5])
+        self.assertEqual(self.dll.find_middle(), 3)
+
+    def test_find_middle_of_empty_list(self):
+        self.assertIsNone(DoublyLinkedList().find_middle())
+        self.assertIsNone(DoublyLinkedList(indexed=True).find_middle())
+
+    def test_indexed_list_matches_python_list(self):
+        rng = random.Random(11)
+        dll = DoublyLinkedList(indexed=True)
+        expected = []
+        for step in range(3000):
+            op = rng.randrange(8)
+            if op == 0:
+                dll.add_to_head(step)
+                expected.insert(0, step)
+            elif op == 1:
+                dll.add_to_tail(step)
+                expected.append(step)
+            elif op == 2 and expected:
+                self.assertEqual(dll.remove_from_head(), expected.pop(0))
+            elif op == 3 and expected:
+                self.assertEqual(dll.remove_from_tail(), expected.pop())
+            elif op == 4:
+                index = rng.randint(0, len(expected))
+                dll.insert_at(index, step)
+                expected.insert(index, step)
+            elif op == 5 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(dll.delete_at(index), expected.pop(index))
+            elif op == 6 and expected:
+                index = rng.randrange(len(expected))
+                dll.move_to_front(dll._node_at(index))
+                expected.insert(0, expected.pop(index))
+            elif op == 7 and expected:
+                index = rng.randrange(len(expected))
+                dll.move_to_end(dll._node_at(index))
+                expected.append(expected.pop(index))
+
+            if expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(dll.get(index), expected[index])
+                self.assertEqual(dll.find_middle(),
+                                 expected[(len(expected) - 1) // 2])
+        self.assertEqual(list(dll), expected)
+
+    def test_index_rebuilds_after_splice(self):
+        dll = DoublyLinkedList(indexed=True)
+        other = DoublyLinkedList(indexed=True)
+        for value in range(50):
+            dll.add_to_tail(value)
+            other.add_to_tail(value + 50)
+
+        dll.splice(other)
+        self.assertEqual(dll.get(75), 75)
+        rest = dll.split_at(dll._node_at(60))
+        self.assertEqual(dll.get(-1), 59)
+        self.assertEqual(rest.get(0), 60)
+        self.assertEqual(rest.find_middle(), 79)
+        self.assertEqual(len(other), 0)
+
+    def test_from_iterable_and_extend(self):
+        dll = DoublyLinkedList.from_iterable(range(5))
+        self.assertEqual(list(dll), [0, 1, 2, 3, 4])
+        self.assertEqual(list(reversed(dll)), [4, 3, 2, 1, 0])
+        self.assertEqual(len(dll), 5)
+
+        dll.extend([5, 6])
+        self.assertEqual(dll.tail.value, 6)
+        self.assertEqual(dll.tail.prev.value, 5)
+        self.assertEqual(len(dll), 7)
+
+        dll.extend(dll)
+        self.assertEqual(list(dll), list(range(7)) * 2)
+
+        empty = DoublyLinkedList()
+        empty.extend([])
+        self.assertIsNone(empty.head)
+        self.assertEqual(len(empty), 0)
+
+    def test_extendleft(self):
+        self.dll.extendleft([2, 3, 4])
+        self.assertEqual(list(self.dll), [4, 3, 2, 1])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(len(self.dll), 4)
+
+        empty = DoublyLinkedList()
+        empty.extendleft([1, 2])
+        self.assertEqual(list(empty), [2, 1])
+        self.assertEqual(empty.tail.value, 1)
+
+    def test_remove_many(self):
+        dll = DoublyLinkedList.from_iterable(range(10))
+        self.assertEqual(dll.remove_many_from_head(3), [0, 1, 2])
+        self.assertIsNone(dll.head.prev)
+        self.assertEqual(dll.remove_many_from_tail(2), [9, 8])
+        self.assertIsNone(dll.tail.next)
+        self.assertEqual(list(dll), [3, 4, 5, 6, 7])
+        self.assertEqual(len(dll), 5)
+
+        self.assertEqual(dll.remove_many_from_tail(10), [7, 6, 5, 4, 3])
+        self.assertIsNone(dll.head)
+        self.assertIsNone(dll.tail)
+        self.assertEqual(len(dll), 0)
+        self.assertEqual(dll.remove_many_from_head(1), [])
+
+    def test_clear(self):
+        dll = DoublyLinkedList.from_iterable([3, 1, 2], track_aggregates=True,
+                                             indexed=True)
+        self.assertEqual(dll.get_max(), 3)
+        self.assertEqual(dll.get(1), 1)
+        dll.clear()
+        self.assertIsNone(dll.head)
+        self.assertIsNone(dll.tail)
+        self.assertEqual(len(dll), 0)
+        self.assertIsNone(dll.get_max())
+        dll.extend([5, 7])
+        self.assertEqual(dll.get_max(), 7)
+        self.assertEqual(dll.get(-1), 7)
+
+    def test_reverse_list(self):
+        for value in range(2, 6):
+            self.dll.add_to_tail(value)
+        head = self.dll.head
+        tail = self.dll.tail
+
+        self.assertIs(self.dll.reverse_list(), self.dll)
+        self.assertIs(self.dll.head, tail)
+        self.assertIs(self.dll.tail, head)
+        self.assertEqual(list(self.dll), [5, 4, 3, 2, 1])
+        self.assertEqual(list(reversed(self.dll)), [1, 2, 3, 4, 5])
+        self.assertEqual(str(self.dll),
+                         '( 5 ) <-> ( 4 ) <-> ( 3 ) <-> ( 2 ) <-> ( 1 ) <-> ')
+        self.assertEqual(self.dll.find_middle(), 3)
+
+        self.dll.add_to_head(6)
+        self.dll.add_to_tail(0)
+        self.assertEqual(self.dll.remove_from_head(), 6)
+        self.assertEqual(list(self.dll), [5, 4, 3, 2, 1, 0])
+        self.assertEqual(self.dll.find_middle(), 3)
+        self.assertEqual(list(self.dll.iter_from(self.dll.head, 2)), [5, 4])
+
+        self.dll.move_to_front(self.dll.tail)
+        self.dll.move_to_end(head)
+        self.assertEqual(list(self.dll), [0, 5, 4, 3, 2, 1])
+
+        self.dll.reverse_list()
+        self.assertEqual(list(self.dll), [1, 2, 3, 4, 5, 0])
+        self.assertEqual(self.dll.head.next.value, 2)
+        # flipped back, the head and tail methods are the plain ones
+        self.assertNotIn('add_to_head', vars(self.dll))
+        self.assertNotIn('remove_from_tail', vars(self.dll))
+        self.dll.add_to_head(9)
+        self.assertEqual(self.dll.remove_from_tail(), 0)
+        self.assertEqual(list(self.dll), [9, 1, 2, 3, 4, 5])
+
+    def test_materialize(self):
+        for value in range(2, 5):
+            self.dll.add_to_tail(value)
+        self.dll.reverse_list().materialize()
+        self.assertEqual(list(self.dll), [4, 3, 2, 1])
+        node = self.dll.head
+        values = []
+        while node is not None:
+            values.append(node.value)
+            node = node.next
+        self.assertEqual(values, [4, 3, 2, 1])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertEqual(self.dll.tail.prev.value, 2)
+
+    def test_reversed_list_matches_python_list(self):
+        rng = random.Random(5)
+        dll = DoublyLinkedList(indexed=True, track_aggregates=True)
+        expected = []
+        for step in range(3000):
+            op = rng.randrange(11)
+            if op == 0:
+                dll.add_to_head(step)
+                expected.insert(0, step)
+            elif op == 1:
+                dll.add_to_tail(step)
+                expected.append(step)
+            elif op == 2 and expected:
+                self.assertEqual(dll.remove_from_head(), expected.pop(0))
+            elif op == 3 and expected:
+                self.assertEqual(dll.remove_from_tail(), expected.pop())
+            elif op == 4:
+                index = rng.randint(0, len(expected))
+                dll.insert_at(index, step)
+                expected.insert(index, step)
+            elif op == 5 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(dll.delete_at(index), expected.pop(index))
+            elif op == 6 and expected:
+                index = rng.randrange(len(expected))
+                dll.move_to_front(dll._node_at(index))
+                expected.insert(0, expected.pop(index))
+            elif op == 7:
+                dll.reverse_list()
+                expected.reverse()
+            elif op == 8:
+                dll.extend([step, -step])
+                expected.extend([step, -step])
+            elif op == 9:
+                dll.extendleft([step, -step])
+                expected[:0] = [-step, step]
+            elif op == 10 and rng.random() < 0.1:
+                dll.materialize()
+
+            if expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(dll.get(index), expected[index])
+                self.assertEqual(dll.head.value, expected[0])
+                self.assertEqual(dll.tail.value, expected[-1])
+                self.assertEqual(dll.get_max(), max(expected))
+        self.assertEqual(list(dll), expected)
+        self.assertEqual(list(reversed(dll)), expected[::-1])
+        self.assertEqual(dll.remove_many_from_head(3), expected[:3])
+        self.assertEqual(dll.remove_many_from_tail(3), expected[:-4:-1])
+
+    def test_splice_and_split_reversed(self):
+        dll = DoublyLinkedList.from_iterable([1, 2, 3])
+        other = DoublyLinkedList.from_iterable([4, 5, 6])
+        other.reverse_list()
+        dll.splice(other)
+        self.assertEqual(list(dll), [1, 2, 3, 6, 5, 4])
+
+        dll.reverse_list()
+        more = DoublyLinkedList.from_iterable([7, 8])
+        dll.splice(more)
+        self.assertEqual(list(dll), [4, 5, 6, 3, 2, 1, 7, 8])
+        self.assertEqual(len(dll), 8)
+
+        rest = dll.split_at(dll._node_at(3))
+        self.assertEqual(list(dll), [4, 5, 6])
+        self.assertEqual(list(rest), [3, 2, 1, 7, 8])
+        self.assertEqual(len(rest), 5)
+
+        dest = DoublyLinkedList.from_iterable([0])
+        rest.move_range(rest._node_at(1), rest._node_at(3), dest)
+        self.assertEqual(list(rest), [3, 8])
+        self.assertEqual(list(dest), [0, 2, 1, 7])
+        self.assertEqual(len(dest), 4)
+
+        dest.reverse_list()
+        dll.move_range(dll.head, dll.head.prev, dest)
+        self.assertEqual(list(dll), [6])
+        self.assertEqual(list(dest), [7, 1, 2, 0, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
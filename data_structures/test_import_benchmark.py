@@ -0,0 +1,33 @@
+import unittest
+import subprocess
+import sys
+from data_structures.import_benchmark import run_import_benchmarks
+
+
+class ImportBenchmarkTests(unittest.TestCase):
+    def test_times_package_and_submodules(self):
+        results = run_import_benchmarks(['dll_queue'], repeat=1)
+        self.assertEqual(list(results),
+                         ['data_structures', 'data_structures.dll_queue'])
+        for seconds in results.values():
+            self.assertGreater(seconds, 0)
+
+    def test_package_import_loads_no_submodules(self):
+        code = ('import sys, data_structures\n'
+                'print(sorted(m for m in sys.modules'
+                ' if m.startswith("data_structures.")))')
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+    def test_lazy_attribute(self):
+        import data_structures
+        from data_structures.dll_stack import Stack
+        self.assertIs(data_structures.Stack, Stack)
+        self.assertIn('LRUCache', dir(data_structures))
+        with self.assertRaises(AttributeError):
+            data_structures.Missing
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from data_structures.instrumentation import (InstrumentedQueue,
+                                             InstrumentedStack, QueueMetrics)
+from data_structures.ring_buffer import RingBuffer
+from data_structures import test_queue
+
+
+class InstrumentedQueueBasicTests(test_queue.QueueTests):
+    def setUp(self):
+        self.q = InstrumentedQueue()
+
+
+class InstrumentedQueueTests(unittest.TestCase):
+    def test_depth_and_counts(self):
+        q = InstrumentedQueue(RingBuffer)
+        for value in range(5):
+            q.enqueue(value)
+        self.assertEqual(q.dequeue(), 0)
+        self.assertEqual(q.dequeue(), 1)
+        q.enqueue(5)
+
+        snapshot = q.snapshot()
+        self.assertEqual(snapshot['depth'], 4)
+        self.assertEqual(snapshot['peak_depth'], 5)
+        self.assertEqual(snapshot['added'], 6)
+        self.assertEqual(snapshot['removed'], 2)
+        self.assertGreater(snapshot['add_rate'], 0)
+
+    def test_empty_dequeue_is_not_counted(self):
+        q = InstrumentedQueue()
+        self.assertIsNone(q.dequeue())
+        self.assertEqual(q.snapshot()['removed'], 0)
+
+    def test_stack_order_and_waits(self):
+        s = InstrumentedStack()
+        s.push('a')
+        s.push('b')
+        self.assertEqual(s.pop(), 'b')
+        self.assertEqual(s.pop(), 'a')
+        self.assertIsNone(s.pop())
+
+        snapshot = s.snapshot()
+        self.assertEqual(sum(snapshot['wait_histogram'].values()), 2)
+        self.assertGreaterEqual(snapshot['wait_max'], snapshot['wait_mean'])
+
+    def test_histogram_buckets(self):
+        metrics = QueueMetrics()
+        for wait in [0.0000005, 0.000003, 0.0000035, 0.5]:
+            metrics.record_add(10.0)
+            metrics.record_remove(10.0 + wait, 10.0)
+        histogram = metrics.snapshot()['wait_histogram']
+        self.assertEqual(histogram, {1e-06: 1, 4e-06: 2, 0.524288: 1})
+
+    def test_rates_are_since_last_snapshot(self):
+        metrics = QueueMetrics()
+        metrics.last_snapshot = (100.0, 0, 0)
+        for _ in range(10):
+            metrics.record_add(100.5)
+        self.assertEqual(metrics.snapshot(now=102.0)['add_rate'], 5.0)
+        self.assertEqual(metrics.snapshot(now=103.0)['add_rate'], 0.0)
+
+    def test_manual_snapshots_leave_the_report_window_alone(self):
+        reports = []
+        metrics = QueueMetrics(callback=reports.append, interval=10)
+        metrics.last_snapshot = metrics.last_report = (100.0, 0, 0)
+        metrics.next_report = 110.0
+        for _ in range(20):
+            metrics.record_add(101.0)
+        self.assertEqual(metrics.snapshot(now=109.0)['add_rate'], 20 / 9)
+        metrics.record_add(110.0)
+        self.assertEqual(reports[-1]['add_rate'], 2.1)
+
+    def test_callback_is_called_each_interval(self):
+        reports = []
+        q = InstrumentedQueue(callback=reports.append, interval=0)
+        q.enqueue(1)
+        q.dequeue()
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[-1]['removed'], 1)
+
+        quiet = []
+        q = InstrumentedQueue(callback=quiet.append, interval=3600)
+        q.enqueue(1)
+        self.assertEqual(quiet, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
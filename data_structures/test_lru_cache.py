@@ -0,0 +1,392 @@
+import unittest
+import threading
+from data_structures.lru_cache import (LRUCache, ShardedLRUCache,
+                                       default_weigher, lru_memoize)
+
+
+class CacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = LRUCache(3)
+
+    def test_cache_overwrite_appropriately(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item3', 'c')
+
+        self.cache.set('item2', 'z')
+
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.assertEqual(self.cache.get('item2'), 'z')
+
+    def test_cache_insertion_and_retrieval(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item3', 'c')
+
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.cache.set('item4', 'd')
+
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.assertEqual(self.cache.get('item3'), 'c')
+        self.assertEqual(self.cache.get('item4'), 'd')
+        self.assertIsNone(self.cache.get('item2'))
+
+    def test_cache_nonexistent_retrieval(self):
+        self.assertIsNone(self.cache.get('nonexistent'))
+
+    def test_cache_repeated_hits_keep_order(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item3', 'c')
+
+        self.cache.get('item1')
+        self.cache.get('item2')
+        self.cache.get('item1')
+        self.cache.set('item4', 'd')
+
+        self.assertIsNone(self.cache.get('item3'))
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.cache.set('item5', 'e')
+
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertEqual(self.cache.get('item4'), 'd')
+        self.assertEqual(self.cache.get('item5'), 'e')
+        self.assertEqual(len(self.cache), 3)
+
+    def test_eviction_follows_recency(self):
+        cache = LRUCache(50)
+        reference = []
+        for step in range(2000):
+            key = (step * 7919) % 120
+            if step % 3:
+                found = cache.get(key)
+                if key in reference:
+                    self.assertEqual(found, key * 2)
+                    reference.remove(key)
+                    reference.append(key)
+                else:
+                    self.assertIsNone(found)
+            else:
+                cache.set(key, key * 2)
+                if key in reference:
+                    reference.remove(key)
+                elif len(reference) == 50:
+                    reference.pop(0)
+                reference.append(key)
+        self.assertEqual(sorted(cache.store), sorted(reference))
+        self.assertEqual(len(cache), len(reference))
+
+    def test_zero_limit_stores_nothing(self):
+        cache = LRUCache(0)
+        cache.set('item1', 'a')
+        self.assertIsNone(cache.get('item1'))
+        self.assertEqual(len(cache), 0)
+
+    def test_counters(self):
+        self.cache.set('item1', 'a')
+        self.cache.get('item1')
+        self.cache.get('item2')
+        for key in ['item2', 'item3', 'item4', 'item5']:
+            self.cache.set(key, key)
+        self.assertEqual((self.cache.hits, self.cache.misses,
+                          self.cache.evictions), (1, 1, 2))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = LRUCache(10, ttl=5, clock=self.clock)
+
+    def test_get_expires_lazily(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b', ttl=60)
+        self.clock.now = 4.9
+        self.assertEqual(self.cache.get('item1'), 'a')
+        self.clock.now = 5
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.expirations, 1)
+        self.assertEqual(len(self.cache.wheel), 1)
+
+    def test_set_refreshes_ttl(self):
+        self.cache.set('item1', 'a')
+        self.clock.now = 4
+        self.cache.set('item1', 'b')
+        self.clock.now = 8
+        self.assertEqual(self.cache.get('item1'), 'b')
+        self.assertEqual(self.cache.expire_due(), 0)
+        self.clock.now = 9
+        self.assertEqual(self.cache.expire_due(), 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_expire_due_sweeps_only_expired(self):
+        for i in range(10):
+            self.cache.set(i, i, ttl=i + 1)
+        self.clock.now = 3.5
+        self.assertEqual(self.cache.expire_due(), 3)
+        self.assertEqual(sorted(self.cache.store), list(range(3, 10)))
+        self.clock.now = 100
+        self.assertEqual(self.cache.expire_due(), 7)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.root.next, self.cache.root)
+
+    def test_evicted_entries_leave_the_wheel(self):
+        cache = LRUCache(2, clock=self.clock)
+        cache.set('item1', 'a', ttl=1)
+        cache.set('item2', 'b')
+        cache.set('item3', 'c', ttl=1)
+        self.assertEqual(len(cache.wheel), 1)
+        self.clock.now = 2
+        self.assertEqual(cache.expire_due(), 1)
+        self.assertEqual(list(cache.store), ['item2'])
+
+    def test_no_ttl_no_wheel(self):
+        cache = LRUCache(2)
+        cache.set('item1', 'a')
+        self.assertIsNone(cache.wheel)
+        self.assertEqual(cache.expire_due(), 0)
+
+
+class WeightedCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = LRUCache(limit=None, max_weight=10)
+
+    def test_evicts_until_it_fits(self):
+        self.cache.set('item1', b'aaaa')
+        self.cache.set('item2', 'bbbb')
+        self.cache.get('item1')
+        self.assertEqual(self.cache.total_weight, 8)
+
+        # 14 doesn't fit in 10, so the least-recently used goes
+        self.cache.set('item3', b'cccccc')
+        self.assertIsNone(self.cache.get('item2'))
+        self.assertEqual(self.cache.total_weight, 10)
+
+        self.cache.set('item4', b'ddddddddd')
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertIsNone(self.cache.get('item3'))
+        self.assertEqual(self.cache.get('item4'), b'ddddddddd')
+        self.assertEqual(self.cache.total_weight, 9)
+        self.assertEqual(self.cache.evictions, 3)
+
+    def test_overwrite_reweighs(self):
+        self.cache.set('item1', 'aaaa')
+        self.cache.set('item2', 'bb')
+        self.cache.set('item1', 'a' * 9)
+        self.assertEqual(self.cache.total_weight, 9)
+        self.assertIsNone(self.cache.get('item2'))
+        self.cache.set('item1', 'a')
+        self.assertEqual(self.cache.total_weight, 1)
+
+    def test_oversized_entries_are_rejected(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'x' * 11)
+        self.assertIsNone(self.cache.get('item2'))
+        self.assertEqual(self.cache.get('item1'), 'a')
+
+        self.cache.set('item1', 'x' * 11)
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertEqual(self.cache.rejections, 2)
+        self.assertEqual(self.cache.total_weight, 0)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_custom_weigher_and_count_limit(self):
+        cache = LRUCache(limit=2, max_weight=100,
+                         weigher=lambda key, value: value)
+        cache.set('item1', 30)
+        cache.set('item2', 30)
+        cache.set('item3', 30)
+        self.assertEqual(sorted(cache.store), ['item2', 'item3'])
+        self.assertEqual(cache.total_weight, 60)
+        cache.set('item4', 80)
+        self.assertEqual(sorted(cache.store), ['item4'])
+
+    def test_default_weigher(self):
+        self.assertEqual(default_weigher('key', b'abc'), 3)
+        self.assertEqual(default_weigher('key', 'abcd'), 4)
+        self.assertEqual(default_weigher('key', memoryview(b'ab')), 2)
+        self.assertGreater(default_weigher('key', [1, 2, 3]), 0)
+
+
+class ShardedCacheTests(unittest.TestCase):
+    def test_shard_limits_sum_to_limit(self):
+        cache = ShardedLRUCache(limit=50, shards=8)
+        self.assertEqual(len(cache.shards), 8)
+        self.assertEqual(sum(shard.limit for shard in cache.shards), 50)
+        self.assertEqual(len(ShardedLRUCache(limit=3, shards=8).shards), 3)
+
+    def test_get_set_and_stats(self):
+        cache = ShardedLRUCache(limit=40, shards=4)
+        for key in range(100):
+            cache.set(key, key * 2)
+        self.assertEqual(len(cache), 40)
+        self.assertEqual(cache.get(99), 198)
+        self.assertIsNone(cache.get(0))
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 60)
+        self.assertEqual(stats['size'], 40)
+        self.assertEqual(stats['limit'], 40)
+        self.assertEqual(len(stats['shards']), 4)
+
+    def test_get_default(self):
+        cache = ShardedLRUCache(limit=10, shards=4)
+        missing = object()
+        cache.set('none', None)
+        self.assertIsNone(cache.get('none', missing))
+        self.assertIs(cache.get('absent', missing), missing)
+
+    def test_threads(self):
+        cache = ShardedLRUCache(limit=64, shards=8)
+        wrong = []
+
+        def work(offset):
+            for i in range(2000):
+                key = (i + offset) % 100
+                value = cache.get(key)
+                if value is None:
+                    cache.set(key, str(key))
+                elif value != str(key):
+                    wrong.append((key, value))
+
+        threads = [threading.Thread(target=work, args=(n * 13,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(wrong, [])
+        self.assertLessEqual(len(cache), 64)
+        for shard in cache.shards:
+            self.assertEqual(len(shard.store), shard.size)
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = ShardedLRUCache(limit=20, shards=4, ttl=10, clock=clock)
+        for key in range(10):
+            cache.set(key, key, ttl=None if key % 2 else 1)
+        clock.now = 2
+        self.assertEqual(cache.expire_due(), 5)
+        self.assertEqual(cache.stats()['expirations'], 5)
+        self.assertEqual(len(cache), 5)
+
+    def test_weight_budget_is_split(self):
+        cache = ShardedLRUCache(limit=None, shards=4, max_weight=1000,
+                                max_entry_weight=200)
+        self.assertEqual([shard.max_weight for shard in cache.shards],
+                         [250] * 4)
+        for key in range(200):
+            cache.set(key, b'x' * 10)
+        stats = cache.stats()
+        self.assertLessEqual(stats['weight'], 1000)
+        self.assertEqual(stats['max_weight'], 1000)
+        self.assertIsNone(stats['limit'])
+
+    def test_entries_heavier_than_a_slice_fit(self):
+        # by default any entry within the whole budget is accepted
+        cache = ShardedLRUCache(limit=None, max_weight=1000)
+        cache.set('k', b'x' * 100)
+        self.assertEqual(cache.get('k'), b'x' * 100)
+        cache.set('big', b'x' * 900)
+        self.assertEqual(cache.get('big'), b'x' * 900)
+        self.assertEqual(cache.stats()['rejections'], 0)
+        cache.set('huge', b'x' * 1001)
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(cache.stats()['rejections'], 1)
+
+        # shards are capped so each slice still fits max_entry_weight
+        cache = ShardedLRUCache(limit=None, max_weight=1000,
+                                max_entry_weight=300)
+        self.assertEqual(len(cache.shards), 3)
+        for key in range(20):
+            cache.set(key, b'x' * 300)
+            self.assertEqual(cache.get(key), b'x' * 300)
+        self.assertEqual(cache.stats()['rejections'], 0)
+        self.assertLessEqual(cache.stats()['weight'], 1000)
+
+
+class MemoizeTests(unittest.TestCase):
+    def test_exported_from_package(self):
+        import data_structures
+        self.assertIs(data_structures.lru_memoize, lru_memoize)
+        self.assertIs(data_structures.default_weigher, default_weigher)
+
+    def test_caches_results(self):
+        calls = []
+
+        @lru_memoize(limit=2)
+        def double(x):
+            """Doubles x"""
+            calls.append(x)
+            return x * 2
+
+        self.assertEqual(double(1), 2)
+        self.assertEqual(double(1), 2)
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(3), 6)
+        self.assertEqual(double(1), 2)
+        self.assertEqual(calls, [1, 2, 3, 1])
+        self.assertEqual(tuple(double.cache_info()), (1, 4, 2, 2, 2))
+        self.assertEqual(double.__name__, 'double')
+        self.assertEqual(double.__doc__, 'Doubles x')
+
+        double.cache_clear()
+        self.assertEqual(tuple(double.cache_info()), (0, 0, 0, 2, 0))
+        double(1)
+        self.assertEqual(calls[-1], 1)
+
+    def test_none_results_are_cached(self):
+        calls = []
+
+        @lru_memoize
+        def nothing(x):
+            calls.append(x)
+
+        nothing(1)
+        nothing(1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(nothing.cache_info().limit, 128)
+
+    def test_keyword_and_typed_keys(self):
+        calls = []
+
+        @lru_memoize(typed=True)
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        add(1, b=2)
+        add(1, b=2)
+        add(1, 2)
+        add(1.0, b=2)
+        self.assertEqual(len(calls), 3)
+
+        untyped = lru_memoize()(lambda a, b: a)
+        untyped(1, 2)
+        untyped(1.0, 2)
+        self.assertEqual(untyped.cache_info().hits, 1)
+
+    def test_custom_key(self):
+        @lru_memoize(key=lambda request: request['id'])
+        def handle(request):
+            return request['body']
+
+        self.assertEqual(handle({'id': 1, 'body': 'a'}), 'a')
+        self.assertEqual(handle({'id': 1, 'body': 'b'}), 'a')
+        self.assertEqual(handle.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import random
+from data_structures.min_max_queue import MinMaxQueue
+from data_structures.ring_buffer import RingBuffer
+from data_structures import test_queue
+
+
+class MinMaxQueueTests(test_queue.QueueTests):
+    def setUp(self):
+        self.q = MinMaxQueue()
+
+    def test_empty_min_and_max(self):
+        self.assertIsNone(self.q.get_min())
+        self.assertIsNone(self.q.get_max())
+
+    def test_sliding_window(self):
+        rng = random.Random(17)
+        values = [rng.randint(0, 100) for _ in range(500)]
+        q = MinMaxQueue(RingBuffer)
+        for i, value in enumerate(values):
+            q.enqueue(value)
+            if q.len() > 7:
+                q.dequeue()
+            window = values[max(0, i - 6):i + 1]
+            self.assertEqual(q.get_min(), min(window))
+            self.assertEqual(q.get_max(), max(window))
+
+
+if __name__ == '__main__':
+    unittest.main()
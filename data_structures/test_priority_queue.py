@@ -0,0 +1,28 @@
+import unittest
+from data_structures.priority_queue import PriorityQueue
+from data_structures import test_queue
+
+
+class PriorityQueueTests(test_queue.QueueTests):
+    def setUp(self):
+        self.q = PriorityQueue()
+
+    def test_lowest_priority_number_first(self):
+        self.q.enqueue('bulk', priority=5)
+        self.q.enqueue('urgent', priority=-1)
+        self.q.enqueue('normal')
+        self.assertEqual(self.q.dequeue(), 'urgent')
+        self.assertEqual(self.q.dequeue(), 'normal')
+        self.assertEqual(self.q.dequeue(), 'bulk')
+
+    def test_ties_are_fifo(self):
+        # dicts can't be compared, so this also checks values never are
+        values = [{'n': n} for n in range(50)]
+        for value in values:
+            self.q.enqueue(value, priority=value['n'] % 3)
+        expected = sorted(values, key=lambda value: value['n'] % 3)
+        self.assertEqual([self.q.dequeue() for _ in range(50)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from dll_queue import Queue
+from data_structures.dll_queue import Queue
+from data_structures.ring_buffer import RingBuffer
 
 
 class QueueTests(unittest.TestCase):
@@ -41,6 +42,11 @@ class QueueTests(unittest.TestCase):
         self.assertIsNone(self.q.dequeue())
         self.assertEqual(self.q.len(), 0)
 
+class RingBufferQueueTests(QueueTests):
+    def setUp(self):
+        self.q = Queue(RingBuffer)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,73 @@
+import unittest
+import random
+from collections import deque
+from data_structures.ring_buffer import RingBuffer
+
+
+class RingBufferTests(unittest.TestCase):
+    def setUp(self):
+        self.rb = RingBuffer(min_capacity=4)
+
+    def test_empty_buffer(self):
+        self.assertEqual(len(self.rb), 0)
+        self.assertIsNone(self.rb.remove_from_head())
+        self.assertIsNone(self.rb.remove_from_tail())
+        self.assertEqual(list(self.rb), [])
+
+    def test_capacity_is_power_of_two(self):
+        self.assertEqual(RingBuffer(min_capacity=5).capacity, 8)
+        self.assertEqual(RingBuffer(min_capacity=8).capacity, 8)
+        self.assertEqual(self.rb.capacity, 4)
+
+    def test_wraps_around(self):
+        for value in range(4):
+            self.rb.add_to_tail(value)
+        self.assertEqual(self.rb.remove_from_head(), 0)
+        self.assertEqual(self.rb.remove_from_head(), 1)
+        self.rb.add_to_tail(4)
+        self.rb.add_to_tail(5)
+        self.assertEqual(self.rb.capacity, 4)
+        self.assertEqual(list(self.rb), [2, 3, 4, 5])
+        self.rb.add_to_head(1)
+        self.assertEqual(self.rb.capacity, 8)
+        self.assertEqual(list(self.rb), [1, 2, 3, 4, 5])
+
+    def test_grows_and_shrinks(self):
+        for value in range(100):
+            self.rb.add_to_tail(value)
+        self.assertEqual(self.rb.capacity, 128)
+        for value in range(90):
+            self.assertEqual(self.rb.remove_from_head(), value)
+        self.assertEqual(self.rb.capacity, 32)
+        while len(self.rb):
+            self.rb.remove_from_tail()
+        self.assertEqual(self.rb.capacity, 4)
+
+    def test_removed_slots_are_cleared(self):
+        self.rb.add_to_tail('a')
+        self.rb.add_to_tail('b')
+        self.rb.remove_from_head()
+        self.rb.remove_from_tail()
+        self.assertEqual(self.rb.buffer, [None] * 4)
+
+    def test_matches_deque(self):
+        rng = random.Random(3)
+        expected = deque()
+        for step in range(5000):
+            op = rng.randrange(4)
+            if op == 0:
+                self.rb.add_to_head(step)
+                expected.appendleft(step)
+            elif op == 1:
+                self.rb.add_to_tail(step)
+                expected.append(step)
+            elif op == 2 and expected:
+                self.assertEqual(self.rb.remove_from_head(), expected.popleft())
+            elif op == 3 and expected:
+                self.assertEqual(self.rb.remove_from_tail(), expected.pop())
+            self.assertEqual(self.rb.length, len(expected))
+        self.assertEqual(list(self.rb), list(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
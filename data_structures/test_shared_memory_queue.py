@@ -0,0 +1,89 @@
+import unittest
+import multiprocessing
+from queue import Empty, Full
+from data_structures.shared_memory_queue import SharedMemoryQueue
+
+
+def produce(q, start, count):
+    for value in range(start, start + count):
+        q.enqueue((value, value * 2.0))
+    q.close()
+
+
+class SharedMemoryQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = SharedMemoryQueue(4, fmt='<qd')
+
+    def tearDown(self):
+        self.q.close()
+        self.q.unlink()
+
+    def test_fifo_order(self):
+        self.q.enqueue((1, 0.5))
+        self.q.enqueue((2, 1.5))
+        self.assertEqual(self.q.len(), 2)
+        self.assertEqual(self.q.dequeue(), (1, 0.5))
+        self.assertEqual(self.q.dequeue(), (2, 1.5))
+        self.assertEqual(self.q.len(), 0)
+
+    def test_wraps_around(self):
+        for value in range(10):
+            self.q.enqueue((value, 0.0))
+            self.assertEqual(self.q.dequeue()[0], value)
+
+    def test_full_and_empty(self):
+        with self.assertRaises(Empty):
+            self.q.dequeue(block=False)
+        with self.assertRaises(Empty):
+            self.q.dequeue(timeout=0.01)
+        for value in range(4):
+            self.q.enqueue((value, 0.0))
+        with self.assertRaises(Full):
+            self.q.enqueue((4, 0.0), block=False)
+        with self.assertRaises(Full):
+            self.q.enqueue((4, 0.0), timeout=0.01)
+        self.assertEqual(self.q.len(), 4)
+
+    def test_bad_record_keeps_slot(self):
+        with self.assertRaises(Exception):
+            self.q.enqueue(('not a number', 0.0))
+        for value in range(4):
+            self.q.enqueue((value, 0.0), block=False)
+        self.assertEqual(self.q.len(), 4)
+
+    def test_single_field_and_raw_bytes(self):
+        with SharedMemoryQueue(2, fmt='i') as q:
+            q.enqueue(7)
+            self.assertEqual(q.dequeue(), 7)
+
+        with SharedMemoryQueue(2, slot_size=3) as q:
+            q.enqueue(b'abc')
+            with self.assertRaises(ValueError):
+                q.enqueue(b'toolong')
+            with q.read() as view:
+                self.assertIsInstance(view, memoryview)
+                self.assertEqual(view.tobytes(), b'abc')
+            self.assertEqual(q.len(), 0)
+
+        with self.assertRaises(ValueError):
+            SharedMemoryQueue(2)
+
+    def test_many_processes(self):
+        q = SharedMemoryQueue(16, fmt='<qd')
+        producers = [multiprocessing.Process(target=produce,
+                                             args=(q, i * 500, 500))
+                     for i in range(3)]
+        for process in producers:
+            process.start()
+        received = [q.dequeue(timeout=10) for _ in range(1500)]
+        for process in producers:
+            process.join()
+
+        self.assertEqual(sorted(v for v, _ in received), list(range(1500)))
+        self.assertTrue(all(d == v * 2.0 for v, d in received))
+        q.close()
+        q.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
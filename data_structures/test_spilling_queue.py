@@ -0,0 +1,104 @@
+import unittest
+import gc
+import os
+import tempfile
+from data_structures.spilling_queue import SpillingQueue
+from data_structures.ring_buffer import RingBuffer
+from data_structures import test_queue
+
+
+class SpillingQueueBasicTests(test_queue.QueueTests):
+    def setUp(self):
+        self.q = SpillingQueue(window=2)
+
+    def tearDown(self):
+        self.q.close()
+
+
+class SpillingQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = SpillingQueue(window=10)
+
+    def tearDown(self):
+        self.q.close()
+
+    def segment_files(self):
+        return os.listdir(self.q.directory)
+
+    def test_no_files_until_window_fills(self):
+        for value in range(19):
+            self.q.enqueue(value)
+        # not even the directory exists before the first spill
+        self.assertIsNone(self.q.directory)
+        self.assertEqual(self.q.storage.length, 10)
+        self.q.enqueue(19)
+        self.assertEqual(len(self.segment_files()), 1)
+
+    def test_fifo_order_across_segments(self):
+        for value in range(105):
+            self.q.enqueue(value)
+        self.assertEqual(self.q.len(), 105)
+        self.assertEqual(len(self.segment_files()), 9)
+        self.assertLessEqual(self.q.storage.length, 10)
+        self.assertLess(len(self.q.back), 10)
+
+        self.assertEqual([self.q.dequeue() for _ in range(105)],
+                         list(range(105)))
+        self.assertEqual(self.q.len(), 0)
+        self.assertIsNone(self.q.dequeue())
+
+    def test_drained_segments_are_deleted(self):
+        for value in range(30):
+            self.q.enqueue(value)
+        self.assertEqual(len(self.segment_files()), 2)
+        for _ in range(11):
+            self.q.dequeue()
+        self.assertEqual(len(self.segment_files()), 1)
+        for _ in range(10):
+            self.q.dequeue()
+        self.assertEqual(self.segment_files(), [])
+
+    def test_interleaved_operations(self):
+        expected = []
+        received = []
+        counter = 0
+        for round in range(20):
+            for _ in range(round * 3):
+                self.q.enqueue({'n': counter})
+                expected.append({'n': counter})
+                counter += 1
+            for _ in range(round * 2):
+                received.append(self.q.dequeue())
+        while self.q.len():
+            received.append(self.q.dequeue())
+        self.assertEqual(received, expected)
+
+    def test_close_removes_files(self):
+        directory = tempfile.mkdtemp()
+        q = SpillingQueue(window=2, directory=directory, engine=RingBuffer)
+        for value in range(10):
+            q.enqueue(value)
+        self.assertTrue(os.listdir(directory))
+        q.close()
+        self.assertEqual(os.listdir(directory), [])
+        os.rmdir(directory)
+
+        with SpillingQueue(window=2) as q:
+            for value in range(10):
+                q.enqueue(value)
+            directory = q.directory
+        self.assertFalse(os.path.exists(directory))
+
+    def test_unclosed_queue_cleans_up_when_collected(self):
+        q = SpillingQueue(window=2)
+        for value in range(10):
+            q.enqueue(value)
+        directory = q.directory
+        self.assertTrue(os.listdir(directory))
+        del q
+        gc.collect()
+        self.assertFalse(os.path.exists(directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """dll_stack test"""
 import unittest
-from dll_stack import Stack
+from data_structures.dll_stack import Stack, MinMaxStack
+from data_structures.ring_buffer import RingBuffer
 
 
 class QueueTests(unittest.TestCase):
@@ -43,5 +44,28 @@ class QueueTests(unittest.TestCase):
         self.assertEqual(self.s.len(), 0)
 
 
+class RingBufferStackTests(QueueTests):
+    def setUp(self):
+        self.s = Stack(RingBuffer)
+
+
+class MinMaxStackTests(QueueTests):
+    def setUp(self):
+        self.s = MinMaxStack()
+
+    def test_min_and_max_follow_pops(self):
+        self.assertIsNone(self.s.get_min())
+        self.assertIsNone(self.s.get_max())
+        for value in [5, 3, 8, 3, 1, 9]:
+            self.s.push(value)
+        expected = [(1, 9), (1, 8), (3, 8), (3, 8), (3, 5), (5, 5)]
+        for low, high in expected:
+            self.assertEqual(self.s.get_min(), low)
+            self.assertEqual(self.s.get_max(), high)
+            self.s.pop()
+        self.assertIsNone(self.s.get_min())
+        self.assertIsNone(self.s.pop())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import random
+from data_structures.timing_wheel import TimingWheel
+
+
+class Item:
+    def __init__(self, expires):
+        self.expires = expires
+        self.timer = None
+
+
+class TimingWheelTests(unittest.TestCase):
+    def test_items_expire_on_time(self):
+        wheel = TimingWheel()
+        items = [Item(t) for t in [0.5, 3, 3.2, 70, 5000, 300000, 10 ** 8]]
+        for item in items:
+            wheel.add(item)
+        self.assertEqual(len(wheel), 7)
+
+        self.assertEqual(wheel.advance(2.9), [items[0]])
+        self.assertEqual(wheel.advance(3), [items[1]])
+        self.assertEqual(wheel.advance(3.9), [])
+        self.assertEqual(wheel.advance(4), [items[2]])
+        self.assertEqual(wheel.advance(69.9), [])
+        self.assertEqual(wheel.advance(70), [items[3]])
+        self.assertEqual(wheel.advance(299999), [items[4]])
+        self.assertEqual(wheel.advance(300000), [items[5]])
+        self.assertEqual(wheel.advance(10 ** 8 - 1), [])
+        self.assertEqual(wheel.advance(10 ** 8), [items[6]])
+        self.assertEqual(len(wheel), 0)
+
+    def test_never_early_and_at_most_a_tick_late(self):
+        rng = random.Random(24)
+        wheel = TimingWheel(resolution=0.25)
+        items = [Item(rng.uniform(0, 2000)) for _ in range(2000)]
+        for item in items:
+            wheel.add(item)
+
+        now = 0.0
+        seen = []
+        while now < 2001:
+            now += rng.uniform(0, 3)
+            for item in wheel.advance(now):
+                self.assertLessEqual(item.expires, now)
+                seen.append(item)
+            for item in items:
+                if item.timer is not None:
+                    self.assertGreater(item.expires, now - 0.25)
+        self.assertEqual(len(seen), len(items))
+
+    def test_remove_and_past_deadlines(self):
+        wheel = TimingWheel(start=100)
+        late = Item(50)
+        kept = Item(200)
+        dropped = Item(150)
+        for item in [late, kept, dropped]:
+            wheel.add(item)
+        wheel.remove(dropped)
+        wheel.remove(dropped)
+        self.assertIsNone(dropped.timer)
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.advance(101), [late])
+        self.assertEqual(wheel.advance(1000), [kept])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import random
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+class UnrolledLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.ull = UnrolledLinkedList(chunk_size=4)
+
+    def chunk_sizes(self):
+        sizes = []
+        chunk = self.ull.head
+        while chunk is not None:
+            sizes.append(len(chunk.values))
+            chunk = chunk.next
+        return sizes
+
+    def test_empty_list(self):
+        self.assertEqual(len(self.ull), 0)
+        self.assertIsNone(self.ull.remove_from_head())
+        self.assertIsNone(self.ull.remove_from_tail())
+        self.assertIsNone(self.ull.get_max())
+        self.assertEqual(str(self.ull), 'empty')
+        with self.assertRaises(IndexError):
+            self.ull[0]
+
+    def test_add_fills_chunks(self):
+        for value in range(10):
+            self.ull.add_to_tail(value)
+        self.assertEqual(self.chunk_sizes(), [4, 4, 2])
+        self.ull.add_to_head(-1)
+        self.assertEqual(self.chunk_sizes(), [1, 4, 4, 2])
+        self.assertEqual(list(self.ull), list(range(-1, 10)))
+        self.assertEqual(len(self.ull), 11)
+
+    def test_getitem(self):
+        for value in range(10):
+            self.ull.add_to_tail(value * 10)
+        self.assertEqual(self.ull[0], 0)
+        self.assertEqual(self.ull[5], 50)
+        self.assertEqual(self.ull[9], 90)
+        self.assertEqual(self.ull[-1], 90)
+        self.ull[3] = 'x'
+        self.assertEqual(self.ull[3], 'x')
+        with self.assertRaises(IndexError):
+            self.ull[10]
+
+    def test_insert_splits_full_chunk(self):
+        for value in range(4):
+            self.ull.add_to_tail(value)
+        self.ull.insert(2, 'x')
+        self.assertEqual(self.chunk_sizes(), [2, 3])
+        self.assertEqual(list(self.ull), [0, 1, 'x', 2, 3])
+        self.assertIs(self.ull.tail.prev, self.ull.head)
+
+    def test_delete_merges_chunks(self):
+        for value in range(8):
+            self.ull.add_to_tail(value)
+        self.assertEqual(self.ull.delete(1), 1)
+        self.assertEqual(self.ull.delete(1), 2)
+        self.assertEqual(self.chunk_sizes(), [2, 4])
+        self.assertEqual(self.ull.delete(2), 4)
+        self.assertEqual(self.chunk_sizes(), [2, 3])
+        self.assertEqual(self.ull.delete(0), 0)
+        self.assertEqual(self.chunk_sizes(), [4])
+        self.assertIs(self.ull.head, self.ull.tail)
+        self.assertEqual(list(self.ull), [3, 5, 6, 7])
+
+    def test_moves_and_max(self):
+        for value in [5, 100, 55, 101, 7]:
+            self.ull.add_to_tail(value)
+        self.ull.move_to_front(3)
+        self.assertEqual(list(self.ull), [101, 5, 100, 55, 7])
+        self.ull.move_to_end(0)
+        self.assertEqual(list(self.ull), [5, 100, 55, 7, 101])
+        self.assertEqual(self.ull.get_max(), 101)
+        self.assertEqual(self.ull.find_middle(), 55)
+
+    def test_matches_python_list(self):
+        rng = random.Random(7)
+        expected = []
+        for _ in range(2000):
+            op = rng.randrange(6)
+            if op == 0:
+                self.ull.add_to_head(len(expected))
+                expected.insert(0, len(expected))
+            elif op == 1:
+                self.ull.add_to_tail(len(expected))
+                expected.append(len(expected))
+            elif op == 2 and expected:
+                self.assertEqual(self.ull.remove_from_head(), expected.pop(0))
+            elif op == 3 and expected:
+                self.assertEqual(self.ull.remove_from_tail(), expected.pop())
+            elif op == 4:
+                index = rng.randint(0, len(expected))
+                self.ull.insert(index, -index)
+                expected.insert(index, -index)
+            elif op == 5 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(self.ull.delete(index), expected.pop(index))
+            self.assertEqual(len(self.ull), len(expected))
+        self.assertEqual(list(self.ull), expected)
+        for size in self.chunk_sizes():
+            self.assertTrue(0 < size <= 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
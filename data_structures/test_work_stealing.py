@@ -0,0 +1,81 @@
+import unittest
+import threading
+from data_structures.work_stealing import (WorkStealingDeque,
+                                          WorkStealingScheduler)
+
+
+def tree_sum(scheduler, depth):
+    """Sums the leaves of a full binary tree, one task per node"""
+    if depth == 0:
+        return 1
+    left = scheduler.submit(tree_sum, scheduler, depth - 1)
+    right = scheduler.submit(tree_sum, scheduler, depth - 1)
+    return scheduler.join(left) + scheduler.join(right)
+
+
+class WorkStealingDequeTests(unittest.TestCase):
+    def test_owner_pops_newest_and_thieves_steal_oldest(self):
+        d = WorkStealingDeque()
+        for value in range(4):
+            d.push(value)
+        self.assertEqual(d.pop(), 3)
+        self.assertEqual(d.steal(), 0)
+        self.assertEqual(d.len(), 2)
+        self.assertEqual(d.steal(), 1)
+        self.assertEqual(d.pop(), 2)
+        self.assertIsNone(d.pop())
+        self.assertIsNone(d.steal())
+
+
+class WorkStealingSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = WorkStealingScheduler(workers=4)
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def test_submit_returns_future(self):
+        future = self.scheduler.submit(pow, 2, exp=10)
+        self.assertEqual(future.result(timeout=5), 1024)
+
+    def test_exceptions_reach_the_future(self):
+        future = self.scheduler.submit(int, 'not a number')
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_recursive_tasks(self):
+        future = self.scheduler.submit(tree_sum, self.scheduler, 8)
+        self.assertEqual(future.result(timeout=10), 256)
+
+        stats = self.scheduler.stats()
+        self.assertEqual(len(stats), 4)
+        self.assertEqual(sum(s['executed'] for s in stats), 511)
+        self.assertTrue(all(s['queued'] == 0 for s in stats))
+
+    def test_idle_workers_steal(self):
+        release = threading.Event()
+        # every outside submit lands on a deque round-robin, so
+        # workers that finish early have to steal the slow ones' work
+        blocker = self.scheduler.submit(release.wait, 5)
+        futures = [self.scheduler.submit(abs, -i) for i in range(200)]
+        # the tasks dealt to the blocked worker can only run if stolen
+        self.assertEqual([f.result(timeout=5) for f in futures],
+                         list(range(200)))
+        release.set()
+        self.assertTrue(blocker.result(timeout=5))
+        stats = self.scheduler.stats()
+        self.assertEqual(sum(s['executed'] for s in stats), 201)
+        self.assertGreater(sum(s['stolen'] for s in stats), 0)
+
+    def test_shutdown_drains_queued_tasks(self):
+        results = []
+        for i in range(100):
+            self.scheduler.submit(results.append, i)
+        self.scheduler.shutdown()
+        self.assertEqual(sorted(results), list(range(100)))
+        with self.assertRaises(RuntimeError):
+            self.scheduler.submit(abs, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Implement a hierarchical timing wheel"""
+import math
+
+# each level has 64 slots, so a slot index is 6 bits of a tick
+_BITS = 6
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+
+
+class TimingWheel:
+    """Tracks when items expire so that finding the expired ones is
+    amortized O(1) per item rather than a scan or a heap.
+
+    Time is cut into ticks of resolution seconds. Level 0 has one
+    slot per tick for the next 64 ticks, level 1 one slot per 64
+    ticks for the next 64 * 64, and so on. An item is filed in the
+    coarsest slot that still separates it from now; when time
+    reaches that slot the items in it cascade down to finer levels,
+    and when a level-0 slot is reached its items are due. Items
+    further out than the top level can cover are parked in its last
+    slot and refiled when it comes round.
+
+    Items are any objects with an expires attribute (seconds on the
+    same clock as advance) and a timer attribute the wheel uses to
+    find the slot holding them, the way LRUCache's entries do. An
+    item is never reported before it expires, and at most one tick
+    after."""
+
+    def __init__(self, resolution=1.0, start=0.0, levels=4):
+        self.resolution = resolution
+        self.levels = [[set() for _ in range(_SLOTS)] for _ in range(levels)]
+        self.tick = self._floor_tick(start)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, item):
+        """Schedules item for item.expires"""
+        # a tick is only processed once, so anything due already
+        # goes in the next one
+        deadline = max(self._ceil_tick(item.expires), self.tick + 1)
+        self._place(item, deadline)
+        self.count += 1
+
+    def remove(self, item):
+        if item.timer is not None:
+            item.timer.discard(item)
+            item.timer = None
+            self.count -= 1
+
+    def advance(self, now):
+        """Moves the wheel forward to now and returns the items that
+        have expired, removing them from the wheel"""
+        target = self._floor_tick(now)
+        expired = []
+        while self.tick < target:
+            # skip the ticks on which nothing happens
+            tick = self._next_event() if self.count else None
+            if tick is None or tick > target:
+                self.tick = target
+                break
+            self.tick = tick
+
+            # cascade every level whose slot boundary this tick is on
+            for level in range(1, len(self.levels)):
+                if tick & ((1 << (_BITS * level)) - 1):
+                    break
+                slot = self.levels[level][(tick >> (_BITS * level)) & _MASK]
+                items = list(slot)
+                slot.clear()
+                for item in items:
+                    self._place(item, self._ceil_tick(item.expires))
+
+            slot = self.levels[0][tick & _MASK]
+            for item in slot:
+                item.timer = None
+            expired.extend(slot)
+            self.count -= len(slot)
+            slot.clear()
+        return expired
+
+    def _next_event(self):
+        """Returns the next tick with a level-0 slot to report or a
+        higher-level slot to cascade, or None if the wheel is empty"""
+        tick = self.tick
+        slots = self.levels[0]
+        event = None
+        for offset in range(1, _SLOTS + 1):
+            if slots[(tick + offset) & _MASK]:
+                event = tick + offset
+                break
+
+        for level in range(1, len(self.levels)):
+            if any(self.levels[level]):
+                # coarser levels only cascade on multiples of this
+                # level's span, so they can't come sooner
+                span = 1 << (_BITS * level)
+                boundary = (tick // span + 1) * span
+                if event is None or boundary < event:
+                    event = boundary
+                break
+        return event
+
+    def _place(self, item, deadline):
+        """Files item in the slot for tick deadline, which must be
+        after the current tick, or equal to it while cascading"""
+        top = len(self.levels) - 1
+        # park anything out of range at the farthest reachable tick
+        deadline = min(deadline, self.tick + (1 << (_BITS * (top + 1))) - 1)
+        delta = deadline - self.tick
+
+        level = 0
+        while level < top and delta >= 1 << (_BITS * (level + 1)):
+            level += 1
+        slot = self.levels[level][(deadline >> (_BITS * level)) & _MASK]
+        slot.add(item)
+        item.timer = slot
+
+    def _floor_tick(self, seconds):
+        return math.floor(seconds / self.resolution)
+
+    def _ceil_tick(self, seconds):
+        return math.ceil(seconds / self.resolution)
@@ -0,0 +1,224 @@
+"""Implement an unrolled doubly linked list"""
+
+
+class Chunk:
+    """Each Chunk holds a small Python list of values along with
+    references to its previous and next chunks."""
+
+    __slots__ = ('values', 'prev', 'next')
+
+    def __init__(self, values=None, prev=None, next=None):
+        self.values = values if values is not None else []
+        self.prev = prev
+        self.next = next
+
+
+class UnrolledLinkedList:
+    """A doubly-linked list of Chunks, each holding up to
+    chunk_size values. It has the same head/tail methods as
+    DoublyLinkedList, but positions are addressed by index instead
+    of by node, since values do not get a node of their own.
+    Chunks are split when an insert overflows them and merged with
+    a neighbour when a delete leaves them less than half full."""
+
+    def __init__(self, chunk_size=32):
+        if chunk_size < 2:
+            raise ValueError('chunk_size must be at least 2')
+        self.chunk_size = chunk_size
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk is not None:
+            yield from chunk.values
+            chunk = chunk.next
+
+    def __str__(self):
+        if self.head is None:
+            return "empty"
+
+        return ''.join(f'( {value} ) <-> ' for value in self)
+
+    def __getitem__(self, index):
+        chunk, offset = self._locate(index)
+        return chunk.values[offset]
+
+    def __setitem__(self, index, value):
+        chunk, offset = self._locate(index)
+        chunk.values[offset] = value
+
+    def __delitem__(self, index):
+        self.delete(index)
+
+    def add_to_head(self, value):
+        """Inserts the value at the front of the head chunk,
+        starting a new head chunk if that one is full."""
+        if self.head is None or len(self.head.values) >= self.chunk_size:
+            self._link_head(Chunk([value]))
+        else:
+            self.head.values.insert(0, value)
+        self.length += 1
+
+    def add_to_tail(self, value):
+        """Appends the value to the tail chunk, starting a new tail
+        chunk if that one is full."""
+        if self.tail is None or len(self.tail.values) >= self.chunk_size:
+            self._link_tail(Chunk([value]))
+        else:
+            self.tail.values.append(value)
+        self.length += 1
+
+    def remove_from_head(self):
+        """Removes and returns the first value in the list"""
+        if self.head is None:
+            return
+        return self._pop(self.head, 0)
+
+    def remove_from_tail(self):
+        """Removes and returns the last value in the list"""
+        if self.tail is None:
+            return
+        return self._pop(self.tail, len(self.tail.values) - 1)
+
+    def insert(self, index, value):
+        """Inserts the value so that it ends up at the given index,
+        splitting the target chunk in half if it is full."""
+        if index < 0:
+            index += self.length
+        if index <= 0:
+            self.add_to_head(value)
+            return
+        if index >= self.length:
+            self.add_to_tail(value)
+            return
+
+        chunk, offset = self._locate(index)
+        chunk.values.insert(offset, value)
+        self.length += 1
+
+        # split an overflowing chunk into two halves
+        if len(chunk.values) > self.chunk_size:
+            half = len(chunk.values) // 2
+            new_chunk = Chunk(chunk.values[half:], chunk, chunk.next)
+            del chunk.values[half:]
+            if chunk.next is None:
+                self.tail = new_chunk
+            else:
+                chunk.next.prev = new_chunk
+            chunk.next = new_chunk
+
+    def delete(self, index):
+        """Removes and returns the value at the given index"""
+        chunk, offset = self._locate(index)
+        return self._pop(chunk, offset)
+
+    def move_to_front(self, index):
+        """Moves the value at the given index to the head"""
+        self.add_to_head(self.delete(index))
+
+    def move_to_end(self, index):
+        """Moves the value at the given index to the tail"""
+        self.add_to_tail(self.delete(index))
+
+    def get_max(self):
+        """Returns the highest value currently in the list"""
+        if self.head is None:
+            return
+
+        curr_max = self.head.values[0]
+        chunk = self.head
+        while chunk is not None:
+            chunk_max = max(chunk.values)
+            if chunk_max > curr_max:
+                curr_max = chunk_max
+            chunk = chunk.next
+
+        return curr_max
+
+    def find_middle(self):
+        """Returns the middle value, the left one if there are
+        two."""
+        if self.head is None:
+            return
+        return self[(self.length - 1) // 2]
+
+    def _locate(self, index):
+        """Returns the chunk holding the given index and the offset
+        of the index inside it, walking from the nearer end."""
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError('list index out of range')
+
+        if index < self.length // 2:
+            # walk forward from the head
+            chunk = self.head
+            while index >= len(chunk.values):
+                index -= len(chunk.values)
+                chunk = chunk.next
+            return chunk, index
+
+        # walk backward from the tail
+        index = self.length - 1 - index
+        chunk = self.tail
+        while index >= len(chunk.values):
+            index -= len(chunk.values)
+            chunk = chunk.prev
+        return chunk, len(chunk.values) - 1 - index
+
+    def _pop(self, chunk, offset):
+        """Removes the value at offset in chunk, then drops the
+        chunk if it emptied or merges it with a neighbour if it is
+        less than half full."""
+        value = chunk.values.pop(offset)
+        self.length -= 1
+
+        if not chunk.values:
+            self._unlink(chunk)
+        elif len(chunk.values) < self.chunk_size // 2:
+            # fold the next chunk in if the two fit in one
+            neighbour = chunk.next
+            if (neighbour is not None and
+                    len(chunk.values) + len(neighbour.values) <= self.chunk_size):
+                chunk.values.extend(neighbour.values)
+                self._unlink(neighbour)
+
+        return value
+
+    def _unlink(self, chunk):
+        """Detaches a chunk from the chain of chunks"""
+        if chunk.prev is None:
+            self.head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+
+        if chunk.next is None:
+            self.tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+
+        chunk.prev = None
+        chunk.next = None
+
+    def _link_head(self, chunk):
+        """Links a detached chunk in as the new head chunk"""
+        chunk.next = self.head
+        if self.head is None:
+            self.tail = chunk
+        else:
+            self.head.prev = chunk
+        self.head = chunk
+
+    def _link_tail(self, chunk):
+        """Links a detached chunk in as the new tail chunk"""
+        chunk.prev = self.tail
+        if self.tail is None:
+            self.head = chunk
+        else:
+            self.tail.next = chunk
+        self.tail = chunk
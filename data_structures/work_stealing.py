@@ -0,0 +1,186 @@
+"""Implement a work-stealing deque and a thread pool that uses it"""
+import concurrent.futures
+import itertools
+import os
+import random
+import threading
+
+from .doubly_linked_list import DoublyLinkedList
+
+
+class WorkStealingDeque:
+    """A per-worker task deque. The owning worker pushes and pops
+    at the head, newest first, which keeps a recursive workload
+    depth-first and its data warm in cache. Other workers steal from
+    the tail, taking the oldest task, which is usually the biggest
+    piece of work left. Each deque has its own lock, so workers only
+    contend when one is stealing from another."""
+
+    def __init__(self, engine=DoublyLinkedList):
+        self.storage = engine()
+        self.lock = threading.Lock()
+
+    def push(self, value):
+        with self.lock:
+            self.storage.add_to_head(value)
+
+    def pop(self):
+        """Removes and returns the newest value, or None"""
+        with self.lock:
+            return self.storage.remove_from_head()
+
+    def steal(self):
+        """Removes and returns the oldest value, or None"""
+        with self.lock:
+            return self.storage.remove_from_tail()
+
+    def len(self):
+        return self.storage.length
+
+
+class WorkStealingScheduler:
+    """Runs callables on a pool of worker threads, each with its own
+    WorkStealingDeque. submit returns a concurrent.futures.Future.
+
+    A task submitted from inside a worker goes on that worker's own
+    deque; one submitted from outside is dealt out round-robin. An
+    idle worker steals from the others, starting at a random one,
+    and sleeps only once every deque is empty. A task that waits on
+    its subtasks should call join(future), which runs other tasks
+    while it waits instead of blocking a worker.
+
+    stats() reports, per worker, how many tasks it ran, how many of
+    those it stole, and how many steal attempts found nothing."""
+
+    def __init__(self, workers=None, engine=DoublyLinkedList):
+        workers = workers or os.cpu_count() or 1
+        self.deques = [WorkStealingDeque(engine) for _ in range(workers)]
+        self.worker_stats = [
+            {'executed': 0, 'stolen': 0, 'failed_steals': 0}
+            for _ in range(workers)
+        ]
+        self.local = threading.local()
+        # next() on a count is atomic, so outside submitters racing
+        # each other still get different deques
+        self.next_deque = itertools.count()
+        self.closed = False
+        # idle workers sleep on this; idle counts them so submit
+        # only takes the lock when someone needs waking
+        self.work_available = threading.Condition()
+        self.idle = 0
+
+        self.threads = [
+            threading.Thread(target=self._work, args=(index,), daemon=True,
+                             name=f'work-stealing-{index}')
+            for index in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) and returns its Future"""
+        index = getattr(self.local, 'index', None)
+        # running tasks may still add subtasks while the pool drains
+        if self.closed and index is None:
+            raise RuntimeError('cannot submit after shutdown')
+
+        future = concurrent.futures.Future()
+        if index is None:
+            index = next(self.next_deque) % len(self.deques)
+        self.deques[index].push((future, fn, args, kwargs))
+
+        if self.idle:
+            with self.work_available:
+                self.work_available.notify()
+        return future
+
+    def join(self, future):
+        """Returns future's result. Inside a worker, runs other tasks
+        until it is done rather than blocking."""
+        index = getattr(self.local, 'index', None)
+        if index is not None:
+            while not future.done():
+                task = self._find_task(index)
+                if task is None:
+                    # everything left is running on other workers
+                    concurrent.futures.wait([future], timeout=0.001)
+                else:
+                    self._run(index, task)
+        return future.result()
+
+    def stats(self):
+        """Returns a list with a dict of counters for each worker"""
+        return [
+            dict(stats, queued=deque.len())
+            for stats, deque in zip(self.worker_stats, self.deques)
+        ]
+
+    def shutdown(self, wait=True):
+        """Stops accepting tasks. The workers finish everything
+        already queued and then exit."""
+        self.closed = True
+        with self.work_available:
+            self.work_available.notify_all()
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+    def _work(self, index):
+        self.local.index = index
+        while True:
+            task = self._find_task(index)
+            if task is not None:
+                self._run(index, task)
+                continue
+
+            with self.work_available:
+                self.idle += 1
+                # look again with the lock held, so a submit made
+                # after the search above can't be missed
+                while not self._has_work():
+                    if self.closed:
+                        self.idle -= 1
+                        return
+                    self.work_available.wait()
+                self.idle -= 1
+
+    def _find_task(self, index):
+        """Pops from the worker's own deque, or steals"""
+        task = self.deques[index].pop()
+        if task is not None:
+            return task
+
+        stats = self.worker_stats[index]
+        count = len(self.deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == index:
+                continue
+            task = self.deques[victim].steal()
+            if task is not None:
+                stats['stolen'] += 1
+                return task
+            stats['failed_steals'] += 1
+        return None
+
+    def _run(self, index, task):
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        self.worker_stats[index]['executed'] += 1
+
+    def _has_work(self):
+        return any(deque.len() for deque in self.deques)
@@ -1,22 +0,0 @@
-class Heap:
-    def __init__(self, comparator):
-        self.storage = []
-        self.comparator = comparator
-
-    def insert(self, value):
-        pass
-
-    def delete(self):
-        pass
-
-    def get_priority(self):
-        pass
-
-    def get_size(self):
-        pass
-
-    def _bubble_up(self, index):
-        pass
-
-    def _sift_down(self, index):
-        pass